@@ -79,6 +79,11 @@ class Settings(BaseSettings):
         description="Enable warm container pool for fast attach",
     )
 
+    warm_pool_size: int = Field(
+        default=1,
+        description="Number of warm containers kept ready to claim",
+    )
+
     warm_health_check_interval: int = Field(
         default=60,
         description="Interval in seconds for warm container health checks",
@@ -1,5 +1,6 @@
 """Container lifecycle manager for Docker operations."""
 
+import asyncio
 from datetime import datetime, timedelta, timezone
 from typing import List
 from uuid import uuid4
@@ -240,8 +241,12 @@ class ContainerManager:
 
             try:
                 # Get Docker container
-                docker_container = self.docker_client.containers.get(container.docker_id)
-                docker_container.stop(timeout=timeout)
+                # Stopping can block for the full timeout; keep the loop free so
+                # several containers can be stopped concurrently
+                docker_container = await asyncio.to_thread(
+                    self.docker_client.containers.get, container.docker_id
+                )
+                await asyncio.to_thread(docker_container.stop, timeout=timeout)
 
                 logger.info(
                     "Docker container stopped",
@@ -1,5 +1,6 @@
 """Filesystem manager for Docker container workspace operations."""
 
+import asyncio
 import hashlib
 import io
 import os
@@ -10,6 +11,7 @@ from dataclasses import dataclass
 from datetime import datetime
 from enum import Enum
 from typing import Any, AsyncIterator, List, Optional
+from uuid import uuid4
 
 from docker import DockerClient
 from docker.errors import APIError, NotFound
@@ -141,36 +143,75 @@ class FilesystemManager:
         except APIError as e:
             raise DockerAPIError(f"Failed to get container: {e}", e)
 
-    def _calculate_etag(self, content: bytes, mtime: Optional[str] = None) -> str:
+    def _calculate_etag(self, content: bytes) -> str:
         """
         Calculate ETag for file content.
 
         Args:
-            content: File content (bytes or str)
-            mtime: Optional modification time (str)
+            content: File content
 
         Returns:
-            ETag string (SHA-256 hash)
-        """
-        # Ensure content is bytes
-        if isinstance(content, str):
-            hash_input = content.encode("utf-8")
-        elif isinstance(content, bytes):
-            hash_input = content
-        else:
-            # Handle other types (e.g., Mock objects in tests)
-            hash_input = str(content).encode("utf-8")
-
-        if mtime:
-            if isinstance(mtime, str):
-                hash_input += mtime.encode("utf-8")
-            elif isinstance(mtime, bytes):
-                hash_input += mtime
-            else:
-                # Handle other types
-                hash_input += str(mtime).encode("utf-8")
+            ETag string (MD5 hash, matching ``md5sum`` inside the container)
+        """
+        return hashlib.md5(content).hexdigest()
+
+    def _read_content(self, container, path: str) -> tuple[bytes, str, int]:
+        """
+        Stream file content out of the container, hashing chunks as they arrive.
+
+        Runs the exec through the low-level API so the exit code of ``cat`` can be
+        inspected once the stream is drained.
+
+        Args:
+            container: Docker container object
+            path: Normalized file path
+
+        Returns:
+            Tuple of (file content, ETag, exit code of cat)
+        """
+        api = self.docker_client.api
+        # stderr is dropped so error text never ends up in the file content
+        exec_id = api.exec_create(
+            container.id, ["cat", path], stdout=True, stderr=False, user="1000:1000"
+        )["Id"]
+
+        hasher = hashlib.md5()
+        chunks = []
+        for chunk in api.exec_start(exec_id, stream=True):
+            if chunk:
+                hasher.update(chunk)
+                chunks.append(chunk)
+
+        exit_code = api.exec_inspect(exec_id)["ExitCode"]
+        return b"".join(chunks), hasher.hexdigest(), exit_code
+
+    async def _etag(self, container, path: str) -> str:
+        """
+        Compute the ETag of an existing file inside the container.
+
+        Hashing happens in the container, so the file body is never transferred.
+
+        Args:
+            container: Docker container object
+            path: Normalized file path
+
+        Returns:
+            Current ETag of the file
 
-        return hashlib.sha256(hash_input).hexdigest()
+        Raises:
+            FileNotFoundError: If file not found
+        """
+        # Hash stdin so md5sum never escapes the file name (it prefixes the
+        # digest with a backslash for names containing one or a newline)
+        md5_cmd = f"md5sum < {shlex.quote(path)}"
+        exec_result = await asyncio.to_thread(
+            container.exec_run, ["sh", "-c", md5_cmd], user="1000:1000"
+        )
+
+        if exec_result.exit_code != 0:
+            raise FileNotFoundError(path)
+
+        return exec_result.output.split()[0].decode()
 
     async def read(self, container_id: str, path: str) -> tuple[bytes, FileInfo]:
         """
@@ -193,9 +234,11 @@ class FilesystemManager:
         container = self._get_container(container_id)
 
         try:
-            # First get file stats
-            stat_cmd = f"stat -c '%s|%a|%Y' {shlex.quote(normalized_path)}"
-            exec_result = container.exec_run(["sh", "-c", stat_cmd], user="1000:1000")
+            # First get file stats, following symlinks like cat does
+            stat_cmd = f"stat -L -c '%s|%a|%Y' {shlex.quote(normalized_path)}"
+            exec_result = await asyncio.to_thread(
+                container.exec_run, ["sh", "-c", stat_cmd], user="1000:1000"
+            )
 
             if exec_result.exit_code != 0:
                 raise FileNotFoundError(path)
@@ -206,31 +249,31 @@ class FilesystemManager:
             size = int(size_str)
             mtime = datetime.fromtimestamp(int(mtime_str))
 
-            # Read file content
-            read_cmd = f"cat {shlex.quote(normalized_path)}"
-            exec_result = container.exec_run(["sh", "-c", read_cmd], user="1000:1000")
-
-            if exec_result.exit_code != 0:
+            # cat of a directory streams nothing, so reject directories up front
+            is_dir_cmd = f"test -d {shlex.quote(normalized_path)} && echo 'yes' || echo 'no'"
+            is_dir_result = await asyncio.to_thread(
+                container.exec_run, ["sh", "-c", is_dir_cmd], user="1000:1000"
+            )
+            if is_dir_result.output.decode().strip() == "yes":
                 raise FileNotFoundError(path)
 
-            content = exec_result.output
-
-            # Calculate etag
-            etag = self._calculate_etag(content, mtime_str)
+            # Read file content
+            content, etag, exit_code = await asyncio.to_thread(
+                self._read_content, container, normalized_path
+            )
 
-            # Determine if it's a directory
-            is_dir_cmd = f"test -d {shlex.quote(normalized_path)} && echo 'yes' || echo 'no'"
-            is_dir_result = container.exec_run(["sh", "-c", is_dir_cmd], user="1000:1000")
-            is_dir = is_dir_result.output.decode().strip() == "yes"
+            # Permission denied, or the file was removed since stat
+            if exit_code != 0:
+                raise FileNotFoundError(path)
 
             file_info = FileInfo(
                 path=normalized_path,
                 size=size,
-                is_dir=is_dir,
+                is_dir=False,
                 permissions=perms,
                 mtime=mtime,
                 etag=etag,
-                mime_type=self._guess_mime_type(normalized_path) if not is_dir else None,
+                mime_type=self._guess_mime_type(normalized_path),
             )
 
             logger.info(f"Read file {normalized_path} from container {container_id}")
@@ -270,12 +313,12 @@ class FilesystemManager:
         container = self._get_container(container_id)
 
         try:
-            # Check etag if provided
-            if if_match_etag:
+            # Check etag only for conditional writes
+            if if_match_etag is not None:
                 try:
-                    _, existing_info = await self.read(container_id, path)
-                    if existing_info.etag != if_match_etag:
-                        raise FileConflictError(path, if_match_etag, existing_info.etag)
+                    current_etag = await self._etag(container, normalized_path)
+                    if current_etag != if_match_etag:
+                        raise FileConflictError(path, if_match_etag, current_etag)
                 except FileNotFoundError:
                     # File doesn't exist, that's ok for new files
                     pass
@@ -284,7 +327,9 @@ class FilesystemManager:
             parent_dir = posixpath.dirname(normalized_path)
             if parent_dir != self.WORKSPACE_ROOT:
                 mkdir_cmd = f"mkdir -p {shlex.quote(parent_dir)}"
-                container.exec_run(["sh", "-c", mkdir_cmd], user="1000:1000")
+                await asyncio.to_thread(
+                    container.exec_run, ["sh", "-c", mkdir_cmd], user="1000:1000"
+                )
 
             # Write file using Docker's put_archive API to avoid command line limits
             # This works with large files (tested up to 1GB+)
@@ -300,18 +345,17 @@ class FilesystemManager:
 
             tarstream.seek(0)
             # put_archive expects the path to the directory where to extract
-            success = container.put_archive(
-                path=parent_dir if parent_dir else self.WORKSPACE_ROOT, data=tarstream.getvalue()
+            success = await asyncio.to_thread(
+                container.put_archive,
+                path=parent_dir if parent_dir else self.WORKSPACE_ROOT,
+                data=tarstream.getvalue(),
             )
 
             if not success:
                 raise DockerAPIError("Failed to write file: put_archive returned False")
 
-            # Get mtime and calculate new etag
-            stat_cmd = f"stat -c '%Y' {shlex.quote(normalized_path)}"
-            stat_result = container.exec_run(["sh", "-c", stat_cmd], user="1000:1000")
-            mtime_str = stat_result.output.decode().strip()
-            new_etag = self._calculate_etag(content, mtime_str)
+            # ETag depends on content only, so no need to stat the written file
+            new_etag = self._calculate_etag(content)
 
             logger.info(f"Wrote file {normalized_path} to container {container_id}")
             return new_etag
@@ -343,12 +387,16 @@ class FilesystemManager:
         try:
             # Use rm -rf to handle both files and directories
             delete_cmd = f"rm -rf {shlex.quote(normalized_path)}"
-            exec_result = container.exec_run(["sh", "-c", delete_cmd], user="1000:1000")
+            exec_result = await asyncio.to_thread(
+                container.exec_run, ["sh", "-c", delete_cmd], user="1000:1000"
+            )
 
             if exec_result.exit_code != 0:
                 # Check if file exists
                 test_cmd = f"test -e {shlex.quote(normalized_path)}"
-                test_result = container.exec_run(["sh", "-c", test_cmd], user="1000:1000")
+                test_result = await asyncio.to_thread(
+                    container.exec_run, ["sh", "-c", test_cmd], user="1000:1000"
+                )
                 if test_result.exit_code != 0:
                     raise FileNotFoundError(path)
                 raise DockerAPIError(f"Failed to delete file: {exec_result.output.decode()}")
@@ -362,6 +410,10 @@ class FilesystemManager:
         """
         Get file or directory information.
 
+        The ETag is derived from path, size and mtime rather than content, so
+        it is cheap to compute but is not accepted as ``if_match_etag`` by
+        write(); use the ETag returned by read() or write() for that.
+
         Args:
             container_id: Container ID
             path: File or directory path
@@ -424,6 +476,8 @@ class FilesystemManager:
         """
         List files in directory.
 
+        Entry ETags are metadata ETags, as returned by stat().
+
         Args:
             container_id: Container ID
             path: Directory path (defaults to workspace root)
@@ -458,41 +512,33 @@ class FilesystemManager:
                 # Directory exists but might be empty
                 return []
 
-            output = exec_result.output.decode().strip()
-            if not output:
-                return []
-
+            # Parse records as bytes; only path and permissions need decoding
             files = []
-            for line in output.split("\n"):
-                if not line:
-                    continue
-
-                parts = line.split("|")
+            for line in exec_result.output.split(b"\n"):
+                parts = line.split(b"|")
                 if len(parts) != 5:
                     continue
 
-                file_path, size_str, perms, mtime_str, file_type = parts
-
-                # Parse mtime (format is timestamp with decimals)
-                mtime_float = float(mtime_str)
-                mtime = datetime.fromtimestamp(mtime_float)
-
-                is_dir = file_type == "d"
-                size = int(size_str) if not is_dir else 0
+                raw_path, size_raw, perms, mtime_raw, file_type = parts
+                file_path = raw_path.decode()
+                is_dir = file_type == b"d"
+                size = 0 if is_dir else int(size_raw)
 
                 # Calculate a simple etag
-                etag = hashlib.sha256(f"{file_path}:{size}:{mtime_str}".encode()).hexdigest()
-
-                file_info = FileInfo(
-                    path=file_path,
-                    size=size,
-                    is_dir=is_dir,
-                    permissions=perms,
-                    mtime=mtime,
-                    etag=etag,
-                    mime_type=self._guess_mime_type(file_path) if not is_dir else None,
+                etag = hashlib.sha256(b"%s:%d:%s" % (raw_path, size, mtime_raw)).hexdigest()
+
+                files.append(
+                    FileInfo(
+                        path=file_path,
+                        size=size,
+                        is_dir=is_dir,
+                        permissions=perms.decode(),
+                        # mtime is a timestamp with decimals
+                        mtime=datetime.fromtimestamp(float(mtime_raw)),
+                        etag=etag,
+                        mime_type=None if is_dir else self._guess_mime_type(file_path),
+                    )
                 )
-                files.append(file_info)
 
             logger.info(
                 f"Listed {len(files)} files in {normalized_path} in container {container_id}"
@@ -537,8 +583,9 @@ class FilesystemManager:
         """
         Execute a batch of filesystem operations atomically.
 
-        Operations are executed in order. If any operation fails, a rollback
-        is attempted (best effort) to restore the original state.
+        Operations on overlapping paths are executed in order, while
+        independent operations run concurrently. If any operation fails, a
+        rollback is attempted (best effort) to restore the original state.
 
         Args:
             container_id: Container ID
@@ -554,7 +601,7 @@ class FilesystemManager:
         """
         container = self._get_container(container_id)
         results: List[OperationResult] = []
-        staging_dir = f"/tmp/mcp_batch_{hashlib.md5(str(datetime.now()).encode()).hexdigest()[:8]}"
+        staging_dir = f"/tmp/mcp_batch_{uuid4().hex[:8]}"
         rollback_info: List[tuple[str, Optional[bytes]]] = []  # (path, original_content)
 
         try:
@@ -566,19 +613,19 @@ class FilesystemManager:
 
             # Check all ETags before starting
             for op in operations:
-                if op.if_match_etag and op.op_type in [
+                if op.if_match_etag is not None and op.op_type in [
                     OperationType.WRITE,
                     OperationType.DELETE,
                 ]:
                     try:
-                        _, existing_info = await self.read(container_id, op.path)
-                        if existing_info.etag != op.if_match_etag:
+                        current_etag = await self._etag(container, self._validate_path(op.path))
+                        if current_etag != op.if_match_etag:
                             return BatchResult(
                                 success=False,
                                 results=[],
                                 error=f"ETag mismatch for {op.path}: "
                                 f"expected {op.if_match_etag}, "
-                                f"got {existing_info.etag}",
+                                f"got {current_etag}",
                             )
                     except FileNotFoundError:
                         # File doesn't exist yet, ok for write operations
@@ -591,122 +638,47 @@ class FilesystemManager:
 
             # Create staging directory
             mkdir_cmd = f"mkdir -p {shlex.quote(staging_dir)}"
-            container.exec_run(["sh", "-c", mkdir_cmd], user="1000:1000")
-
-            # Execute operations
-            for op in operations:
-                try:
-                    if op.op_type == OperationType.READ:
-                        content, file_info = await self.read(container_id, op.path)
-                        results.append(
-                            OperationResult(
-                                success=True,
-                                op_type=op.op_type,
-                                path=op.path,
-                                data={"content": content, "info": file_info},
-                            )
-                        )
-
-                    elif op.op_type == OperationType.WRITE:
-                        # Save original content for rollback
-                        try:
-                            original_content, _ = await self.read(container_id, op.path)
-                            rollback_info.append((op.path, original_content))
-                        except FileNotFoundError:
-                            rollback_info.append((op.path, None))
-
-                        etag = await self.write(container_id, op.path, op.content, op.if_match_etag)
-                        results.append(
-                            OperationResult(
-                                success=True,
-                                op_type=op.op_type,
-                                path=op.path,
-                                data={"etag": etag},
-                            )
-                        )
-
-                    elif op.op_type == OperationType.DELETE:
-                        # Save original for rollback
-                        try:
-                            original_content, _ = await self.read(container_id, op.path)
-                            rollback_info.append((op.path, original_content))
-                        except FileNotFoundError:
-                            rollback_info.append((op.path, None))
-
-                        await self.delete(container_id, op.path)
-                        results.append(
-                            OperationResult(success=True, op_type=op.op_type, path=op.path)
-                        )
-
-                    elif op.op_type == OperationType.MOVE:
-                        if not op.dest_path:
-                            raise ValueError("dest_path required for MOVE operation")
-
-                        # Read source
-                        content, _ = await self.read(container_id, op.path)
-                        rollback_info.append((op.path, content))
-                        rollback_info.append((op.dest_path, None))
-
-                        # Write to destination
-                        await self.write(container_id, op.dest_path, content)
-                        # Delete source
-                        await self.delete(container_id, op.path)
-
-                        results.append(
-                            OperationResult(
-                                success=True,
-                                op_type=op.op_type,
-                                path=op.path,
-                                data={"dest_path": op.dest_path},
-                            )
-                        )
-
-                    elif op.op_type == OperationType.COPY:
-                        if not op.dest_path:
-                            raise ValueError("dest_path required for COPY operation")
-
-                        # Read source
-                        content, _ = await self.read(container_id, op.path)
-                        rollback_info.append((op.dest_path, None))
-
-                        # Write to destination
-                        await self.write(container_id, op.dest_path, content)
+            await asyncio.to_thread(container.exec_run, ["sh", "-c", mkdir_cmd], user="1000:1000")
+
+            # Execute operations in waves; operations within a wave touch
+            # disjoint paths, so their Docker round-trips can overlap
+            for wave in self._plan_batch_waves(operations):
+                outcomes = await asyncio.gather(
+                    *(self._dispatch(container_id, op, rollback_info) for op in wave),
+                    return_exceptions=True,
+                )
 
+                first_error: Optional[BaseException] = None
+                for op, outcome in zip(wave, outcomes):
+                    if isinstance(outcome, BaseException):
+                        logger.error(f"Batch operation failed at {op.path}: {outcome}")
+                        first_error = first_error or outcome
                         results.append(
                             OperationResult(
-                                success=True,
+                                success=False,
                                 op_type=op.op_type,
                                 path=op.path,
-                                data={"dest_path": op.dest_path},
+                                error=str(outcome),
                             )
                         )
+                    else:
+                        results.append(outcome)
 
-                except Exception as e:
-                    # Operation failed, perform rollback
-                    logger.error(f"Batch operation failed at {op.path}: {e}, performing rollback")
-
-                    # Best-effort rollback
+                if first_error is not None:
+                    # Operation failed, perform best-effort rollback
+                    logger.error("Performing batch rollback")
                     await self._rollback_operations(container_id, rollback_info)
 
-                    results.append(
-                        OperationResult(
-                            success=False,
-                            op_type=op.op_type,
-                            path=op.path,
-                            error=str(e),
-                        )
-                    )
-
                     return BatchResult(
                         success=False,
                         results=results,
                         rollback_performed=True,
-                        error=str(e),
+                        error=str(first_error),
                     )
 
             # Clean up staging directory
             cleanup_cmd = f"rm -rf {shlex.quote(staging_dir)}"
-            container.exec_run(["sh", "-c", cleanup_cmd], user="1000:1000")
+            await asyncio.to_thread(container.exec_run, ["sh", "-c", cleanup_cmd], user="1000:1000")
 
             logger.info(
                 f"Completed batch of {len(operations)} operations in container {container_id}"
@@ -718,7 +690,9 @@ class FilesystemManager:
             # Clean up staging directory on error
             try:
                 cleanup_cmd = f"rm -rf {shlex.quote(staging_dir)}"
-                container.exec_run(["sh", "-c", cleanup_cmd], user="1000:1000")
+                await asyncio.to_thread(
+                    container.exec_run, ["sh", "-c", cleanup_cmd], user="1000:1000"
+                )
             except Exception as cleanup_exc:
                 logger.warning(f"Failed to clean up staging directory {staging_dir}: {cleanup_exc}")
 
@@ -728,6 +702,156 @@ class FilesystemManager:
                 error=str(e),
             )
 
+    @staticmethod
+    def _paths_overlap(first: str, second: str) -> bool:
+        """
+        Check whether two normalized paths are the same or nested.
+
+        Args:
+            first: Normalized path
+            second: Normalized path
+
+        Returns:
+            True if one path equals or contains the other
+        """
+        return (
+            first == second
+            or second.startswith(first.rstrip("/") + "/")
+            or first.startswith(second.rstrip("/") + "/")
+        )
+
+    def _plan_batch_waves(self, operations: List[BatchOperation]) -> List[List[BatchOperation]]:
+        """
+        Group batch operations into waves of independent operations.
+
+        Operations that touch overlapping paths land in different waves, so
+        they keep their relative order while unrelated operations run together.
+
+        Args:
+            operations: Operations in request order
+
+        Returns:
+            List of waves, each a list of operations on disjoint paths
+        """
+        waves: List[List[BatchOperation]] = []
+        wave_paths: List[str] = []
+
+        for op in operations:
+            op_paths = [self._validate_path(op.path)]
+            if op.dest_path:
+                op_paths.append(self._validate_path(op.dest_path))
+
+            conflict = any(
+                self._paths_overlap(op_path, wave_path)
+                for op_path in op_paths
+                for wave_path in wave_paths
+            )
+            if not waves or conflict:
+                waves.append([])
+                wave_paths = []
+
+            waves[-1].append(op)
+            wave_paths.extend(op_paths)
+
+        return waves
+
+    async def _dispatch(
+        self,
+        container_id: str,
+        op: BatchOperation,
+        rollback_info: List[tuple[str, Optional[bytes]]],
+    ) -> OperationResult:
+        """
+        Execute a single batch operation.
+
+        Args:
+            container_id: Container ID
+            op: Operation to execute
+            rollback_info: Shared list collecting (path, original_content) entries
+
+        Returns:
+            Result of the operation
+
+        Raises:
+            Exception: Any error raised by the underlying operation
+        """
+        if op.op_type == OperationType.READ:
+            content, file_info = await self.read(container_id, op.path)
+            return OperationResult(
+                success=True,
+                op_type=op.op_type,
+                path=op.path,
+                data={"content": content, "info": file_info},
+            )
+
+        if op.op_type == OperationType.WRITE:
+            # Save original content for rollback
+            try:
+                original_content, _ = await self.read(container_id, op.path)
+                rollback_info.append((op.path, original_content))
+            except FileNotFoundError:
+                rollback_info.append((op.path, None))
+
+            etag = await self.write(container_id, op.path, op.content, op.if_match_etag)
+            return OperationResult(
+                success=True,
+                op_type=op.op_type,
+                path=op.path,
+                data={"etag": etag},
+            )
+
+        if op.op_type == OperationType.DELETE:
+            # Save original for rollback
+            try:
+                original_content, _ = await self.read(container_id, op.path)
+                rollback_info.append((op.path, original_content))
+            except FileNotFoundError:
+                rollback_info.append((op.path, None))
+
+            await self.delete(container_id, op.path)
+            return OperationResult(success=True, op_type=op.op_type, path=op.path)
+
+        if op.op_type == OperationType.MOVE:
+            if not op.dest_path:
+                raise ValueError("dest_path required for MOVE operation")
+
+            # Read source
+            content, _ = await self.read(container_id, op.path)
+            rollback_info.append((op.path, content))
+            rollback_info.append((op.dest_path, None))
+
+            # Write to destination
+            await self.write(container_id, op.dest_path, content)
+            # Delete source
+            await self.delete(container_id, op.path)
+
+            return OperationResult(
+                success=True,
+                op_type=op.op_type,
+                path=op.path,
+                data={"dest_path": op.dest_path},
+            )
+
+        if op.op_type == OperationType.COPY:
+            if not op.dest_path:
+                raise ValueError("dest_path required for COPY operation")
+
+            # Read source
+            content, _ = await self.read(container_id, op.path)
+            rollback_info.append((op.dest_path, None))
+
+            # Write to destination
+            await self.write(container_id, op.dest_path, content)
+
+            return OperationResult(
+                success=True,
+                op_type=op.op_type,
+                path=op.path,
+                data={"dest_path": op.dest_path},
+            )
+
+        raise ValueError(f"Unsupported operation type: {op.op_type}")
+
     async def _rollback_operations(
         self, container_id: str, rollback_info: List[tuple[str, Optional[bytes]]]
     ) -> None:
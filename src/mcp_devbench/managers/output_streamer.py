@@ -1,9 +1,9 @@
 """Output streaming for command executions with bounded ring buffers."""
 
-import asyncio
 from collections import deque
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from datetime import datetime, timezone
+from itertools import islice
 from typing import Deque, Dict, List, Optional
 
 from mcp_devbench.utils import get_logger
@@ -11,26 +11,33 @@ from mcp_devbench.utils import get_logger
 logger = get_logger(__name__)
 
 
-@dataclass
+@dataclass(slots=True)
 class OutputChunk:
-    """A chunk of output from a command execution."""
+    """A chunk of output from a command execution.
+
+    Slotted because a busy exec can buffer up to max_chunks of these.
+    """
 
     seq: int
     stream: str  # "stdout" or "stderr"
     data: bytes
     ts: datetime
+    # Decoded data, filled on first poll; chunks evicted unpolled never decode
+    _text: Optional[str] = field(default=None, init=False, repr=False, compare=False)
 
     def to_dict(self) -> Dict:
         """Convert to dictionary for serialization."""
+        if self._text is None:
+            self._text = self.data.decode("utf-8", errors="replace")
         return {
             "seq": self.seq,
             "stream": self.stream,
-            "data": self.data.decode("utf-8", errors="replace"),
+            "data": self._text,
             "ts": self.ts.isoformat(),
         }
 
 
-@dataclass
+@dataclass(slots=True)
 class CompletionChunk:
     """Final chunk indicating completion of execution."""
 
@@ -56,6 +63,10 @@ class OutputStreamer:
 
     Uses bounded ring buffers to prevent memory exhaustion and supports
     cursor-based polling for ordered delivery.
+
+    All methods run on the event loop and never await while touching the
+    buffers, so each call is atomic with respect to other coroutines and
+    needs no lock.
     """
 
     # Default maximum buffer size per exec (64MB)
@@ -64,6 +75,9 @@ class OutputStreamer:
     # Maximum number of chunks to keep in buffer
     DEFAULT_MAX_CHUNKS = 10000
 
+    # Small consecutive writes to one stream are merged up to this chunk size
+    COALESCE_MAX_BYTES = 4096
+
     def __init__(
         self,
         max_buffer_size: int = DEFAULT_MAX_BUFFER_SIZE,
@@ -88,17 +102,12 @@ class OutputStreamer:
         # Total buffered bytes per exec ID
         self._buffered_bytes: Dict[str, int] = {}
 
-        # Lock for thread-safe operations
-        self._locks: Dict[str, asyncio.Lock] = {}
-
         # Completion flags
         self._completed: Dict[str, bool] = {}
 
-    def _get_lock(self, exec_id: str) -> asyncio.Lock:
-        """Get or create lock for exec ID."""
-        if exec_id not in self._locks:
-            self._locks[exec_id] = asyncio.Lock()
-        return self._locks[exec_id]
+        # Highest sequence number handed out by poll per exec ID; chunks at or
+        # below it are sealed and never grow
+        self._polled_seq: Dict[str, int] = {}
 
     async def init_exec(self, exec_id: str) -> None:
         """
@@ -107,68 +116,85 @@ class OutputStreamer:
         Args:
             exec_id: Exec ID
         """
-        lock = self._get_lock(exec_id)
-        async with lock:
-            if exec_id not in self._buffers:
-                self._buffers[exec_id] = deque()
-                self._sequences[exec_id] = 0
-                self._buffered_bytes[exec_id] = 0
-                self._completed[exec_id] = False
+        if exec_id not in self._buffers:
+            self._buffers[exec_id] = deque()
+            self._sequences[exec_id] = 0
+            self._buffered_bytes[exec_id] = 0
+            self._completed[exec_id] = False
 
-                logger.debug("Initialized output streaming", extra={"exec_id": exec_id})
+            logger.debug("Initialized output streaming", extra={"exec_id": exec_id})
 
-    async def add_output(self, exec_id: str, stream: str, data: bytes) -> Optional[int]:
+    async def add_output(
+        self, exec_id: str, stream: str, data: bytes, coalesce: bool = True
+    ) -> Optional[int]:
         """
         Add output chunk to the stream.
 
+        When coalescing, data is appended to the newest chunk if it is from the
+        same stream, has not been polled yet and stays within COALESCE_MAX_BYTES.
+
         Args:
             exec_id: Exec ID
             stream: Stream type ("stdout" or "stderr")
             data: Output data
+            coalesce: Whether data may be merged into the previous chunk
 
         Returns:
-            Sequence number of added chunk, or None if buffer is full
+            Sequence number of the chunk holding the data, or None if buffer is full
         """
         if not data:
             return None
 
-        lock = self._get_lock(exec_id)
-        async with lock:
-            # Check if we have space in buffer
-            if self._buffered_bytes.get(exec_id, 0) + len(data) > self.max_buffer_size:
-                logger.warning(
-                    "Output buffer full, dropping data",
-                    extra={
-                        "exec_id": exec_id,
-                        "buffered_bytes": self._buffered_bytes[exec_id],
-                        "data_size": len(data),
-                    },
-                )
-                return None
-
-            # Check chunk limit
-            if len(self._buffers.get(exec_id, [])) >= self.max_chunks:
-                # Remove oldest chunk
-                oldest = self._buffers[exec_id].popleft()
-                if isinstance(oldest, OutputChunk):
-                    self._buffered_bytes[exec_id] -= len(oldest.data)
-
-            # Create chunk
-            seq = self._sequences[exec_id]
-            self._sequences[exec_id] += 1
-
-            chunk = OutputChunk(
-                seq=seq,
-                stream=stream,
-                data=data,
-                ts=datetime.now(timezone.utc),
+        # Check if we have space in buffer
+        if self._buffered_bytes.get(exec_id, 0) + len(data) > self.max_buffer_size:
+            logger.warning(
+                "Output buffer full, dropping data",
+                extra={
+                    "exec_id": exec_id,
+                    "buffered_bytes": self._buffered_bytes[exec_id],
+                    "data_size": len(data),
+                },
             )
+            return None
 
-            # Add to buffer
-            self._buffers[exec_id].append(chunk)
-            self._buffered_bytes[exec_id] += len(data)
-
-            return seq
+        buffer = self._buffers.get(exec_id)
+        if coalesce and buffer:
+            last = buffer[-1]
+            if (
+                isinstance(last, OutputChunk)
+                and last.stream == stream
+                and last.seq > self._polled_seq.get(exec_id, -1)
+                and len(last.data) + len(data) <= self.COALESCE_MAX_BYTES
+            ):
+                last.data += data
+                last._text = None
+                last.ts = datetime.now(timezone.utc)
+                self._buffered_bytes[exec_id] += len(data)
+                return last.seq
+
+        # Check chunk limit
+        if len(self._buffers.get(exec_id, [])) >= self.max_chunks:
+            # Remove oldest chunk
+            oldest = self._buffers[exec_id].popleft()
+            if isinstance(oldest, OutputChunk):
+                self._buffered_bytes[exec_id] -= len(oldest.data)
+
+        # Create chunk
+        seq = self._sequences[exec_id]
+        self._sequences[exec_id] += 1
+
+        chunk = OutputChunk(
+            seq=seq,
+            stream=stream,
+            data=data,
+            ts=datetime.now(timezone.utc),
+        )
+
+        # Add to buffer
+        self._buffers[exec_id].append(chunk)
+        self._buffered_bytes[exec_id] += len(data)
+
+        return seq
 
     async def complete(self, exec_id: str, exit_code: int, usage: Dict) -> int:
         """
@@ -182,35 +208,33 @@ class OutputStreamer:
         Returns:
             Sequence number of completion chunk
         """
-        lock = self._get_lock(exec_id)
-        async with lock:
-            seq = self._sequences.get(exec_id, 0)
-            self._sequences[exec_id] = seq + 1
-
-            chunk = CompletionChunk(
-                seq=seq,
-                exit_code=exit_code,
-                usage=usage,
-                ts=datetime.now(timezone.utc),
-            )
+        seq = self._sequences.get(exec_id, 0)
+        self._sequences[exec_id] = seq + 1
 
-            if exec_id in self._buffers:
-                self._buffers[exec_id].append(chunk)
-            else:
-                self._buffers[exec_id] = deque([chunk])
+        chunk = CompletionChunk(
+            seq=seq,
+            exit_code=exit_code,
+            usage=usage,
+            ts=datetime.now(timezone.utc),
+        )
 
-            self._completed[exec_id] = True
+        if exec_id in self._buffers:
+            self._buffers[exec_id].append(chunk)
+        else:
+            self._buffers[exec_id] = deque([chunk])
 
-            logger.info(
-                "Exec completed",
-                extra={
-                    "exec_id": exec_id,
-                    "exit_code": exit_code,
-                    "seq": seq,
-                },
-            )
+        self._completed[exec_id] = True
 
-            return seq
+        logger.info(
+            "Exec completed",
+            extra={
+                "exec_id": exec_id,
+                "exit_code": exit_code,
+                "seq": seq,
+            },
+        )
+
+        return seq
 
     async def poll(self, exec_id: str, after_seq: Optional[int] = None) -> tuple[List[Dict], bool]:
         """
@@ -223,20 +247,24 @@ class OutputStreamer:
         Returns:
             Tuple of (chunks, is_complete)
         """
-        lock = self._get_lock(exec_id)
-        async with lock:
-            if exec_id not in self._buffers:
-                return [], False
+        if exec_id not in self._buffers:
+            return [], False
+
+        buffer = self._buffers[exec_id]
 
-            # Filter chunks by sequence
-            chunks = []
-            for chunk in self._buffers[exec_id]:
-                if after_seq is None or chunk.seq > after_seq:
-                    chunks.append(chunk.to_dict())
+        # Buffered sequence numbers are contiguous (chunks are only appended
+        # and evicted from the left), so the first unseen chunk sits at a
+        # fixed offset from the oldest one and nothing before it is visited
+        start = 0
+        if after_seq is not None and buffer:
+            start = max(0, after_seq - buffer[0].seq + 1)
+        chunks = [chunk.to_dict() for chunk in islice(buffer, start, None)]
+        if buffer:
+            self._polled_seq[exec_id] = buffer[-1].seq
 
-            is_complete = self._completed.get(exec_id, False)
+        is_complete = self._completed.get(exec_id, False)
 
-            return chunks, is_complete
+        return chunks, is_complete
 
     async def get_stats(self, exec_id: str) -> Dict:
         """
@@ -248,15 +276,13 @@ class OutputStreamer:
         Returns:
             Statistics dictionary
         """
-        lock = self._get_lock(exec_id)
-        async with lock:
-            return {
-                "exec_id": exec_id,
-                "buffered_bytes": self._buffered_bytes.get(exec_id, 0),
-                "chunk_count": len(self._buffers.get(exec_id, [])),
-                "current_seq": self._sequences.get(exec_id, 0),
-                "is_complete": self._completed.get(exec_id, False),
-            }
+        return {
+            "exec_id": exec_id,
+            "buffered_bytes": self._buffered_bytes.get(exec_id, 0),
+            "chunk_count": len(self._buffers.get(exec_id, [])),
+            "current_seq": self._sequences.get(exec_id, 0),
+            "is_complete": self._completed.get(exec_id, False),
+        }
 
     async def cleanup(self, exec_id: str) -> None:
         """
@@ -265,20 +291,18 @@ class OutputStreamer:
         Args:
             exec_id: Exec ID
         """
-        lock = self._get_lock(exec_id)
-        async with lock:
-            if exec_id in self._buffers:
-                del self._buffers[exec_id]
-            if exec_id in self._sequences:
-                del self._sequences[exec_id]
-            if exec_id in self._buffered_bytes:
-                del self._buffered_bytes[exec_id]
-            if exec_id in self._completed:
-                del self._completed[exec_id]
-            if exec_id in self._locks:
-                del self._locks[exec_id]
-
-            logger.debug("Cleaned up output buffers", extra={"exec_id": exec_id})
+        if exec_id in self._buffers:
+            del self._buffers[exec_id]
+        if exec_id in self._sequences:
+            del self._sequences[exec_id]
+        if exec_id in self._buffered_bytes:
+            del self._buffered_bytes[exec_id]
+        if exec_id in self._completed:
+            del self._completed[exec_id]
+        if exec_id in self._polled_seq:
+            del self._polled_seq[exec_id]
+
+        logger.debug("Cleaned up output buffers", extra={"exec_id": exec_id})
 
     async def cleanup_old(self, max_age_seconds: int = 3600) -> int:
         """
@@ -294,17 +318,15 @@ class OutputStreamer:
         exec_ids_to_clean = []
 
         for exec_id in list(self._buffers.keys()):
-            lock = self._get_lock(exec_id)
-            async with lock:
-                # Check if complete and has old chunks
-                if self._completed.get(exec_id, False) and self._buffers.get(exec_id):
-                    buffer = self._buffers[exec_id]
-                    if buffer:
-                        # Check age of last chunk
-                        last_chunk = buffer[-1]
-                        age = (datetime.now(timezone.utc) - last_chunk.ts).total_seconds()
-                        if age > max_age_seconds:
-                            exec_ids_to_clean.append(exec_id)
+            # Check if complete and has old chunks
+            if self._completed.get(exec_id, False) and self._buffers.get(exec_id):
+                buffer = self._buffers[exec_id]
+                if buffer:
+                    # Check age of last chunk
+                    last_chunk = buffer[-1]
+                    age = (datetime.now(timezone.utc) - last_chunk.ts).total_seconds()
+                    if age > max_age_seconds:
+                        exec_ids_to_clean.append(exec_id)
 
         # Clean up identified execs
         for exec_id in exec_ids_to_clean:
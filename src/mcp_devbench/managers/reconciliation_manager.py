@@ -1,7 +1,7 @@
 """Reconciliation manager for boot recovery and state synchronization."""
 
 from datetime import datetime, timezone
-from typing import List
+from typing import List, Optional
 
 from docker import DockerClient
 from docker.errors import APIError
@@ -47,6 +47,9 @@ class ReconciliationManager:
             "errors": 0,
         }
 
+        # One reference time for every record touched in this pass
+        now = datetime.now(timezone.utc)
+
         try:
             # Find all containers with our label
             docker_containers = self._discover_containers()
@@ -65,7 +68,7 @@ class ReconciliationManager:
                 for docker_container in docker_containers:
                     if docker_container.id not in db_docker_ids:
                         try:
-                            await self._adopt_container(docker_container, session)
+                            await self._adopt_container(docker_container, session, now)
                             stats["adopted"] += 1
                         except Exception as e:
                             logger.error(
@@ -75,20 +78,20 @@ class ReconciliationManager:
                             stats["errors"] += 1
 
                 # Clean up stopped containers not in Docker
-                for db_container in db_containers:
-                    if db_container.docker_id and db_container.docker_id not in docker_ids:
-                        try:
-                            await self._cleanup_missing_container(db_container, session)
-                            stats["cleaned_up"] += 1
-                        except Exception as e:
-                            logger.error(
-                                "Failed to clean up missing container",
-                                extra={"container_id": db_container.id, "error": str(e)},
-                            )
-                            stats["errors"] += 1
+                missing = [
+                    c for c in db_containers if c.docker_id and c.docker_id not in docker_ids
+                ]
+                try:
+                    stats["cleaned_up"] = await self._cleanup_missing_containers(missing, session)
+                except Exception as e:
+                    logger.error(
+                        "Failed to clean up missing containers",
+                        extra={"container_ids": [c.id for c in missing], "error": str(e)},
+                    )
+                    stats["errors"] += 1
 
                 # Handle orphaned transient containers
-                orphaned = await self._handle_orphaned_transients(session)
+                orphaned = await self._handle_orphaned_transients(session, now)
                 stats["orphaned"] = orphaned
 
                 # Clean up incomplete execs
@@ -121,13 +124,19 @@ class ReconciliationManager:
             logger.error("Failed to discover containers", extra={"error": str(e)})
             return []
 
-    async def _adopt_container(self, docker_container: DockerContainer, session) -> None:
+    async def _adopt_container(
+        self,
+        docker_container: DockerContainer,
+        session,
+        now: Optional[datetime] = None,
+    ) -> None:
         """
         Adopt a running container into the database.
 
         Args:
             docker_container: Docker container to adopt
             session: Database session
+            now: Timestamp for created_at/last_seen (defaults to the current time)
         """
         # Extract metadata from labels
         labels = docker_container.labels or {}
@@ -164,6 +173,9 @@ class ReconciliationManager:
         else:
             status = "error"
 
+        if now is None:
+            now = datetime.now(timezone.utc)
+
         # Create container record
         container = Container(
             id=container_id,
@@ -172,8 +184,8 @@ class ReconciliationManager:
             image=image,
             digest=None,
             persistent=persistent,
-            created_at=datetime.now(timezone.utc),
-            last_seen=datetime.now(timezone.utc),
+            created_at=now,
+            last_seen=now,
             ttl_s=None,
             volume_name=volume_name,
             status=status,
@@ -191,40 +203,47 @@ class ReconciliationManager:
             },
         )
 
-    async def _cleanup_missing_container(self, container: Container, session) -> None:
+    async def _cleanup_missing_containers(self, containers: List[Container], session) -> int:
         """
-        Clean up a container that exists in DB but not in Docker.
+        Clean up containers that exist in DB but not in Docker.
 
         Args:
-            container: Container record from database
+            containers: Container records from database
             session: Database session
+
+        Returns:
+            Number of containers marked as stopped
         """
         repo = ContainerRepository(session)
 
-        # Update status to stopped
-        await repo.update_status(container.id, "stopped")
+        # Mark all of them stopped in a single UPDATE
+        updated = await repo.update_status_bulk([c.id for c in containers], "stopped")
 
-        logger.info(
-            "Marked missing container as stopped",
-            extra={
-                "container_id": container.id,
-                "docker_id": container.docker_id,
-            },
-        )
+        for container in containers:
+            logger.info(
+                "Marked missing container as stopped",
+                extra={
+                    "container_id": container.id,
+                    "docker_id": container.docker_id,
+                },
+            )
+
+        return updated
 
-    async def _handle_orphaned_transients(self, session) -> int:
+    async def _handle_orphaned_transients(self, session, now: Optional[datetime] = None) -> int:
         """
         Handle orphaned transient containers based on MCP_TRANSIENT_GC_DAYS.
 
         Args:
             session: Database session
+            now: Reference time for the age cutoff (defaults to the current time)
 
         Returns:
             Number of containers cleaned up
         """
         repo = ContainerRepository(session)
         cleaned = await cleanup_orphaned_transients(
-            self.docker_client, repo, self.settings.transient_gc_days
+            self.docker_client, repo, self.settings.transient_gc_days, now
         )
         return cleaned
 
@@ -1,6 +1,7 @@
 """Security controls and policies for containers."""
 
 from dataclasses import dataclass
+from types import MappingProxyType
 from typing import Dict, List, Optional
 
 from mcp_devbench.config import get_settings
@@ -58,6 +59,10 @@ class SecurityManager:
         """Initialize security manager."""
         self.settings = get_settings()
         self._default_policy = SecurityPolicy()
+        # The default policy never changes, so its config is built once
+        self._default_container_config = MappingProxyType(
+            self._build_container_config(self._default_policy)
+        )
 
     def get_container_security_config(
         self,
@@ -76,17 +81,45 @@ class SecurityManager:
         """
         policy = custom_policy or self._default_policy
 
-        config = {}
-
         # User configuration
         if as_root:
             logger.warning(
                 "Container will run as root",
                 extra={"security_warning": "privileged_execution"},
             )
-            config["user"] = "0:0"
+            user = "0:0"
+        else:
+            user = f"{policy.default_uid}:{policy.default_gid}"
+
+        # Fresh top-level dict per call; list values are shared and must not be mutated
+        if custom_policy is None:
+            config = {"user": user, **self._default_container_config}
         else:
-            config["user"] = f"{policy.default_uid}:{policy.default_gid}"
+            config = {"user": user, **self._build_container_config(custom_policy)}
+
+        logger.debug(
+            "Generated container security config",
+            extra={
+                "as_root": as_root,
+                "read_only": config.get("read_only"),
+                "cap_drop": config.get("cap_drop"),
+                "memory_limit": config.get("mem_limit"),
+            },
+        )
+
+        return config
+
+    def _build_container_config(self, policy: SecurityPolicy) -> Dict:
+        """
+        Build the user-independent part of a container security configuration.
+
+        Args:
+            policy: Security policy to translate
+
+        Returns:
+            Dictionary of Docker security parameters without "user"
+        """
+        config = {}
 
         # Security options
         security_opt = []
@@ -130,16 +163,6 @@ class SecurityManager:
                 # PID limit
                 config["pids_limit"] = limits.pids_limit
 
-        logger.debug(
-            "Generated container security config",
-            extra={
-                "as_root": as_root,
-                "read_only": config.get("read_only"),
-                "cap_drop": config.get("cap_drop"),
-                "memory_limit": config.get("mem_limit"),
-            },
-        )
-
         return config
 
     def get_exec_security_config(self, as_root: bool = False) -> Dict:
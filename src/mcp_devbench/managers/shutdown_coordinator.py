@@ -110,23 +110,11 @@ class ShutdownCoordinator:
                 # Get all running transient containers
                 transients = await repo.list_by_status(status="running", persistent=False)
 
-                stopped_count = 0
-                for container in transients:
-                    try:
-                        await container_manager.stop_container(container.id, timeout=10)
-                        stopped_count += 1
-                        logger.info(
-                            "Stopped transient container",
-                            extra={"container_id": container.id},
-                        )
-                    except Exception as e:
-                        logger.error(
-                            "Failed to stop transient container",
-                            extra={
-                                "container_id": container.id,
-                                "error": str(e),
-                            },
-                        )
+                # Each stop may wait out its full timeout, so stop them all at once
+                results = await asyncio.gather(
+                    *(self._stop_transient(container_manager, c.id) for c in transients)
+                )
+                stopped_count = sum(results)
 
                 logger.info(
                     "Transient containers stopped",
@@ -139,6 +127,29 @@ class ShutdownCoordinator:
                 extra={"error": str(e)},
             )
 
+    async def _stop_transient(self, container_manager: ContainerManager, container_id: str) -> bool:
+        """
+        Stop one transient container, logging instead of raising on failure.
+
+        Args:
+            container_manager: Container manager to stop the container with
+            container_id: Container ID
+
+        Returns:
+            True if the container was stopped
+        """
+        try:
+            await container_manager.stop_container(container_id, timeout=10)
+        except Exception as e:
+            logger.error(
+                "Failed to stop transient container",
+                extra={"container_id": container_id, "error": str(e)},
+            )
+            return False
+
+        logger.info("Stopped transient container", extra={"container_id": container_id})
+        return True
+
     async def wait_for_shutdown(self) -> None:
         """Wait for shutdown to complete."""
         await self._shutdown_event.wait()
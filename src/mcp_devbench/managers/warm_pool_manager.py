@@ -1,7 +1,8 @@
 """Warm container pool manager for fast container provisioning."""
 
 import asyncio
-from typing import Optional
+from collections import deque
+from typing import Deque, Optional
 
 from docker.errors import NotFound
 
@@ -11,6 +12,12 @@ from mcp_devbench.utils import get_logger
 
 logger = get_logger(__name__)
 
+# Healthy checks stretch the interval up to this multiple of the configured one
+HEALTH_CHECK_MAX_BACKOFF = 5
+
+# Empties /workspace, including dotfiles but not the "." and ".." entries
+WORKSPACE_CLEAN_CMD = ("sh", "-c", "rm -rf /workspace/* /workspace/.[!.]* 2>/dev/null || true")
+
 
 class WarmPoolManager:
     """Manager for warm container pool."""
@@ -24,11 +31,14 @@ class WarmPoolManager:
         """
         self.settings = get_settings()
         self.container_manager = container_manager
-        self._warm_container: Optional[Container] = None
+        self._warm_pool: Deque[Container] = deque()
         self._lock = asyncio.Lock()
+        # Held for the whole (slow) refill so claims only contend on _lock
+        self._fill_lock = asyncio.Lock()
         self._health_check_task: Optional[asyncio.Task] = None
         self._warm_creation_task: Optional[asyncio.Task] = None
         self._is_running = False
+        self._health_check_interval = self.settings.warm_health_check_interval
 
     async def start(self) -> None:
         """Start the warm pool manager."""
@@ -38,7 +48,7 @@ class WarmPoolManager:
 
         self._is_running = True
 
-        # Create initial warm container
+        # Fill the pool up front
         await self._ensure_warm_container()
 
         # Start health check task
@@ -48,6 +58,7 @@ class WarmPoolManager:
             "Warm pool started",
             extra={
                 "default_image": self.settings.default_image_alias,
+                "pool_size": self.settings.warm_pool_size,
                 "health_check_interval": self.settings.warm_health_check_interval,
             },
         )
@@ -68,7 +79,7 @@ class WarmPoolManager:
 
     async def claim_warm_container(self, alias: Optional[str] = None) -> Optional[Container]:
         """
-        Claim the warm container atomically.
+        Claim the oldest warm container atomically.
 
         Args:
             alias: Optional alias to assign to the claimed container
@@ -80,13 +91,12 @@ class WarmPoolManager:
             return None
 
         async with self._lock:
-            if self._warm_container is None:
+            if not self._warm_pool:
                 logger.debug("No warm container available")
                 return None
 
             # Claim the container
-            container = self._warm_container
-            self._warm_container = None
+            container = self._warm_pool.popleft()
 
             logger.info(
                 "Warm container claimed",
@@ -111,50 +121,59 @@ class WarmPoolManager:
                         container.alias = alias
                         await session.commit()
 
-            # Start creating a new warm container async
+            # Start refilling the pool async
             # Store task reference to handle exceptions in health check loop
             self._warm_creation_task = asyncio.create_task(self._ensure_warm_container())
 
             return container
 
     async def _ensure_warm_container(self) -> None:
-        """Ensure a warm container exists."""
-        async with self._lock:
-            if self._warm_container is not None:
-                return
-
-            try:
-                # Create new warm container
-                container = await self.container_manager.create_container(
-                    image=self.settings.default_image_alias,
-                    alias=None,  # No alias for warm containers
-                    persistent=False,
-                    ttl_s=None,
-                )
+        """
+        Create warm containers until the pool holds warm_pool_size of them.
 
-                # Start the container
-                await self.container_manager.start_container(container.id)
+        Only one refill runs at a time. Calls made while one is in flight return at
+        once, since the running refill re-checks the pool size before every create.
+        """
+        if self._fill_lock.locked():
+            return
 
-                # Clean workspace (ensure it's empty)
-                await self._clean_workspace(container.id)
+        async with self._fill_lock:
+            while len(self._warm_pool) < self.settings.warm_pool_size:
+                try:
+                    # Create new warm container
+                    container = await self.container_manager.create_container(
+                        image=self.settings.default_image_alias,
+                        alias=None,  # No alias for warm containers
+                        persistent=False,
+                        ttl_s=None,
+                    )
+
+                    # Start the container
+                    await self.container_manager.start_container(container.id)
+
+                    # Clean workspace (ensure it's empty)
+                    await self._clean_workspace(container.id)
+
+                except Exception as e:
+                    logger.error(
+                        "Failed to create warm container",
+                        extra={"error": str(e)},
+                    )
+                    # Leave the rest to the next health check
+                    return
 
-                self._warm_container = container
+                async with self._lock:
+                    self._warm_pool.append(container)
 
                 logger.info(
                     "Warm container created",
                     extra={
                         "container_id": container.id,
                         "image": self.settings.default_image_alias,
+                        "pool_size": len(self._warm_pool),
                     },
                 )
 
-            except Exception as e:
-                logger.error(
-                    "Failed to create warm container",
-                    extra={"error": str(e)},
-                )
-                self._warm_container = None
-
     async def _clean_workspace(self, container_id: str) -> None:
         """
         Clean the workspace directory in a container.
@@ -174,7 +193,7 @@ class WarmPoolManager:
             # This is more reliable than fire-and-forget with a sleep.
             result = await asyncio.to_thread(
                 docker_container.exec_run,
-                cmd="sh -c 'rm -rf /workspace/* /workspace/.* 2>/dev/null || true'",
+                cmd=list(WORKSPACE_CLEAN_CMD),
                 user="1000",
             )
 
@@ -265,39 +284,13 @@ class WarmPoolManager:
                     finally:
                         self._warm_creation_task = None
 
-                await asyncio.sleep(self.settings.warm_health_check_interval)
-
-                async with self._lock:
-                    if self._warm_container is None:
-                        # No warm container, try to create one
-                        await self._ensure_warm_container()
-                        continue
-
-                    # Check health
-                    is_healthy = await self._check_container_health(self._warm_container)
-
-                    if not is_healthy:
-                        logger.warning(
-                            "Warm container unhealthy, recreating",
-                            extra={"container_id": self._warm_container.id},
-                        )
-
-                        # Remove unhealthy container
-                        try:
-                            await self.container_manager.remove_container(
-                                self._warm_container.id,
-                                force=True,
-                            )
-                        except Exception as e:
-                            logger.error(
-                                "Failed to remove unhealthy container",
-                                extra={"error": str(e)},
-                            )
+                await asyncio.sleep(self._health_check_interval)
 
-                        self._warm_container = None
+                all_healthy = await self._check_warm_pool()
+                self._adjust_health_check_interval(all_healthy)
 
-                        # Create new one
-                        await self._ensure_warm_container()
+                # Replace evicted or claimed containers
+                await self._ensure_warm_container()
 
             except asyncio.CancelledError:
                 break
@@ -307,14 +300,75 @@ class WarmPoolManager:
                     extra={"error": str(e)},
                 )
 
+    async def _check_warm_pool(self) -> bool:
+        """
+        Health check every warm container, removing the unhealthy ones.
+
+        Probes run concurrently on a snapshot of the pool without holding the lock,
+        so claims are never stuck behind Docker round trips.
+
+        Returns:
+            True if the pool was non-empty and every container in it was healthy
+        """
+        async with self._lock:
+            snapshot = list(self._warm_pool)
+
+        if not snapshot:
+            return False
+
+        results = await asyncio.gather(*(self._check_container_health(c) for c in snapshot))
+        unhealthy_ids = {c.id for c, is_healthy in zip(snapshot, results) if not is_healthy}
+        if not unhealthy_ids:
+            return True
+
+        # Containers claimed while the probes ran belong to their new owner now
+        async with self._lock:
+            evicted = [c for c in self._warm_pool if c.id in unhealthy_ids]
+            self._warm_pool = deque(c for c in self._warm_pool if c.id not in unhealthy_ids)
+
+        for container in evicted:
+            logger.warning(
+                "Warm container unhealthy, recreating",
+                extra={"container_id": container.id},
+            )
+
+            # Remove unhealthy container
+            try:
+                await self.container_manager.remove_container(container.id, force=True)
+            except Exception as e:
+                logger.error(
+                    "Failed to remove unhealthy container",
+                    extra={"error": str(e)},
+                )
+
+        return False
+
+    def _adjust_health_check_interval(self, is_healthy: bool) -> None:
+        """
+        Adapt the health check interval to the last result.
+
+        Each healthy check doubles the interval, up to HEALTH_CHECK_MAX_BACKOFF times
+        the configured one; anything else snaps it back to the configured interval.
+
+        Args:
+            is_healthy: Whether the last check found a healthy warm container
+        """
+        base = self.settings.warm_health_check_interval
+        if is_healthy:
+            self._health_check_interval = min(
+                self._health_check_interval * 2, base * HEALTH_CHECK_MAX_BACKOFF
+            )
+        else:
+            self._health_check_interval = base
+
     def get_warm_container_id(self) -> Optional[str]:
         """
-        Get the ID of the current warm container.
+        Get the ID of the warm container that would be claimed next.
 
         Returns:
             Container ID or None if no warm container
         """
-        return self._warm_container.id if self._warm_container else None
+        return self._warm_pool[0].id if self._warm_pool else None
 
 
 # Singleton instance
@@ -117,7 +117,9 @@ class FileWriteInput(BaseModel):
     container_id: str = Field(..., description="Container ID")
     path: str = Field(..., description="Path to file within /workspace")
     content: bytes = Field(..., description="File content to write")
-    if_match_etag: Optional[str] = Field(None, description="Required etag for conditional write")
+    if_match_etag: Optional[str] = Field(
+        None, description="Required etag (from fs_read or fs_write) for conditional write"
+    )
 
 
 class FileWriteOutput(BaseModel):
@@ -157,7 +159,9 @@ class FileStatOutput(BaseModel):
     is_dir: bool = Field(..., description="Whether path is a directory")
     permissions: str = Field(..., description="File permissions")
     mtime: datetime = Field(..., description="Last modification time")
-    etag: str = Field(..., description="Entity tag")
+    etag: str = Field(
+        ..., description="Metadata entity tag (path, size, mtime); not valid as if_match_etag"
+    )
     mime_type: Optional[str] = Field(None, description="MIME type if file")
 
 
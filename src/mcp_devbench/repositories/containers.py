@@ -3,7 +3,7 @@
 from datetime import datetime, timedelta, timezone
 from typing import List
 
-from sqlalchemy import select
+from sqlalchemy import select, update
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from mcp_devbench.models.containers import Container
@@ -143,6 +143,29 @@ class ContainerRepository(BaseRepository[Container]):
             await self.session.refresh(container)
         return container
 
+    async def update_status_bulk(self, container_ids: List[str], status: str) -> int:
+        """
+        Update the status of several containers in one statement.
+
+        Args:
+            container_ids: Container IDs to update
+            status: New status
+
+        Returns:
+            Number of containers updated
+        """
+        if not container_ids:
+            return 0
+
+        stmt = (
+            update(Container)
+            .where(Container.id.in_(container_ids))
+            .values(status=status, last_seen=datetime.now(timezone.utc))
+        )
+        result = await self.session.execute(stmt)
+        await self.session.flush()
+        return result.rowcount
+
     async def update_last_seen(self, container_id: str) -> Container | None:
         """
         Update container's last_seen timestamp.
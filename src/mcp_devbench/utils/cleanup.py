@@ -1,6 +1,7 @@
 """Shared cleanup utilities for container management."""
 
 from datetime import datetime, timedelta, timezone
+from typing import Optional
 
 from docker import DockerClient
 from docker.errors import NotFound
@@ -15,6 +16,7 @@ async def cleanup_orphaned_transients(
     docker_client: DockerClient,
     repo: ContainerRepository,
     transient_gc_days: int,
+    now: Optional[datetime] = None,
 ) -> int:
     """
     Clean up orphaned transient containers based on age.
@@ -26,11 +28,14 @@ async def cleanup_orphaned_transients(
         docker_client: Docker client instance
         repo: Container repository instance
         transient_gc_days: Days to keep transient containers before cleanup
+        now: Reference time for the pass (defaults to the current time)
 
     Returns:
         Number of containers cleaned up
     """
-    cutoff = datetime.now(timezone.utc) - timedelta(days=transient_gc_days)
+    if now is None:
+        now = datetime.now(timezone.utc)
+    cutoff = now - timedelta(days=transient_gc_days)
     transients = await repo.list_by_status("stopped", persistent=False)
 
     cleaned = 0
@@ -60,7 +65,7 @@ async def cleanup_orphaned_transients(
                     "Cleaned up orphaned transient container",
                     extra={
                         "container_id": container.id,
-                        "age_days": (datetime.now(timezone.utc) - container.last_seen).days,
+                        "age_days": (now - container.last_seen).days,
                     },
                 )
             except Exception as e:
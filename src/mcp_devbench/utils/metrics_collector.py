@@ -1,37 +1,71 @@
 """Prometheus metrics collection for MCP DevBench."""
 
-from typing import Optional
+from typing import Callable, Dict, Iterator, Optional, Tuple
 
 from prometheus_client import (
+    REGISTRY,
+    CollectorRegistry,
     Counter,
     Gauge,
     Histogram,
     generate_latest,
 )
+from prometheus_client.core import GaugeMetricFamily
+from prometheus_client.registry import Collector
+
+
+class ContainerMemoryCollector(Collector):
+    """Per-container memory gauge whose samples are built only when scraped."""
+
+    def __init__(self):
+        """Initialize with no containers reported."""
+        self.values: Dict[str, float] = {}
+
+    def collect(self) -> Iterator[GaugeMetricFamily]:
+        """Yield the memory gauge family from the latest reported values."""
+        family = GaugeMetricFamily(
+            "mcp_devbench_memory_usage_bytes",
+            "Memory usage in bytes per container",
+            labels=["container_id"],
+        )
+        # Snapshot so concurrent updates cannot resize the dict mid-iteration
+        for container_id, memory_bytes in list(self.values.items()):
+            family.add_metric([container_id], memory_bytes)
+        yield family
 
 
 class MetricsCollector:
     """Collects and exposes Prometheus metrics for MCP DevBench operations."""
 
-    def __init__(self):
-        """Initialize metrics collector with all metrics."""
+    def __init__(self, registry: CollectorRegistry = REGISTRY):
+        """
+        Initialize metrics collector with all metrics.
+
+        Args:
+            registry: Registry to register metrics in and expose from
+        """
+        self.registry = registry
+
         # Counter metrics
         self.container_spawns_total = Counter(
             "mcp_devbench_container_spawns_total",
             "Total number of container spawns",
             ["image"],
+            registry=registry,
         )
 
         self.exec_total = Counter(
             "mcp_devbench_exec_total",
             "Total number of command executions",
             ["container_id", "status"],
+            registry=registry,
         )
 
         self.fs_operations_total = Counter(
             "mcp_devbench_fs_operations_total",
             "Total number of filesystem operations",
             ["op_type"],
+            registry=registry,
         )
 
         # Histogram metrics
@@ -39,30 +73,38 @@ class MetricsCollector:
             "mcp_devbench_exec_duration_seconds",
             "Execution duration in seconds",
             buckets=[0.1, 0.5, 1.0, 5.0, 10.0, 30.0, 60.0, 300.0, 600.0],
+            registry=registry,
         )
 
         self.output_bytes = Histogram(
             "mcp_devbench_output_bytes",
             "Output size in bytes",
             buckets=[100, 1000, 10000, 100000, 1000000, 10000000],
+            registry=registry,
         )
 
         # Gauge metrics
         self.active_containers = Gauge(
             "mcp_devbench_active_containers",
             "Number of active containers",
+            registry=registry,
         )
 
         self.active_attachments = Gauge(
             "mcp_devbench_active_attachments",
             "Number of active client attachments",
+            registry=registry,
         )
 
-        self.memory_usage_bytes = Gauge(
-            "mcp_devbench_memory_usage_bytes",
-            "Memory usage in bytes per container",
-            ["container_id"],
-        )
+        # Updates are plain dict stores; samples are materialized per scrape
+        self.memory_usage_bytes = ContainerMemoryCollector()
+        registry.register(self.memory_usage_bytes)
+
+        # Bound child methods per label values; labels() validates and locks on
+        # every call, so the hot recorders look children up only once
+        self._spawn_inc: Dict[str, Callable[[], None]] = {}
+        self._exec_inc: Dict[Tuple[str, str], Callable[[], None]] = {}
+        self._fs_inc: Dict[str, Callable[[], None]] = {}
 
     def record_container_spawn(self, image: str) -> None:
         """
@@ -71,7 +113,10 @@ class MetricsCollector:
         Args:
             image: Image used for the container
         """
-        self.container_spawns_total.labels(image=image).inc()
+        inc = self._spawn_inc.get(image)
+        if inc is None:
+            inc = self._spawn_inc[image] = self.container_spawns_total.labels(image=image).inc
+        inc()
 
     def record_exec(self, container_id: str, status: str) -> None:
         """
@@ -81,7 +126,13 @@ class MetricsCollector:
             container_id: Container ID where the command was executed
             status: Execution status (success, failure, cancelled)
         """
-        self.exec_total.labels(container_id=container_id, status=status).inc()
+        key = (container_id, status)
+        inc = self._exec_inc.get(key)
+        if inc is None:
+            inc = self._exec_inc[key] = self.exec_total.labels(
+                container_id=container_id, status=status
+            ).inc
+        inc()
 
     def record_exec_duration(self, duration_seconds: float) -> None:
         """
@@ -99,7 +150,10 @@ class MetricsCollector:
         Args:
             op_type: Type of operation (read, write, delete, stat, list)
         """
-        self.fs_operations_total.labels(op_type=op_type).inc()
+        inc = self._fs_inc.get(op_type)
+        if inc is None:
+            inc = self._fs_inc[op_type] = self.fs_operations_total.labels(op_type=op_type).inc
+        inc()
 
     def record_output_size(self, size_bytes: int) -> None:
         """
@@ -136,7 +190,7 @@ class MetricsCollector:
             container_id: Container ID
             memory_bytes: Memory usage in bytes
         """
-        self.memory_usage_bytes.labels(container_id=container_id).set(memory_bytes)
+        self.memory_usage_bytes.values[container_id] = memory_bytes
 
     def get_metrics(self) -> bytes:
         """
@@ -145,7 +199,7 @@ class MetricsCollector:
         Returns:
             Metrics data in bytes
         """
-        return generate_latest()
+        return generate_latest(self.registry)
 
 
 # Global metrics collector instance
@@ -1,9 +1,11 @@
 """Test configuration and fixtures."""
 
-import asyncio
+import os
+import tempfile
 from typing import AsyncGenerator
 
 import pytest
+import pytest_asyncio
 from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine
 from sqlalchemy.orm import sessionmaker
 
@@ -12,12 +14,12 @@ from mcp_devbench.models.database import init_db
 from mcp_devbench.utils.docker_client import get_docker_client
 
 
-@pytest.fixture(scope="session")
-def event_loop():
-    """Create event loop for async tests."""
-    loop = asyncio.get_event_loop_policy().new_event_loop()
-    yield loop
-    loop.close()
+def pytest_configure(config):
+    """Give each xdist worker its own state database so workers never share one file."""
+    worker = os.environ.get("PYTEST_XDIST_WORKER")
+    if worker and "MCP_STATE_DB" not in os.environ:
+        state_dir = tempfile.mkdtemp(prefix=f"mcp-devbench-{worker}-")
+        os.environ["MCP_STATE_DB"] = os.path.join(state_dir, "state.db")
 
 
 @pytest.fixture
@@ -43,9 +45,9 @@ async def db_session(test_db_engine) -> AsyncGenerator[AsyncSession, None]:
         await session.rollback()
 
 
-@pytest.fixture(scope="session", autouse=True)
+@pytest_asyncio.fixture(scope="session", loop_scope="session")
 async def setup_integration_env():
-    """Setup environment for integration tests."""
+    """Setup database and Docker image for tests that drive a real daemon."""
     # Initialize database for integration tests
     await init_db()
 
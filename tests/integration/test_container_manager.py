@@ -8,8 +8,9 @@ from mcp_devbench.utils.exceptions import (
     ContainerNotFoundError,
 )
 
+pytestmark = [pytest.mark.slow, pytest.mark.usefixtures("setup_integration_env")]
+
 
-@pytest.mark.asyncio
 async def test_create_and_start_container():
     """Test creating and starting a container."""
     manager = ContainerManager()
@@ -40,7 +41,6 @@ async def test_create_and_start_container():
             pass  # Ignore cleanup errors in test teardown
 
 
-@pytest.mark.asyncio
 async def test_create_container_with_duplicate_alias():
     """Test that creating a container with duplicate alias fails."""
     manager = ContainerManager()
@@ -65,7 +65,6 @@ async def test_create_container_with_duplicate_alias():
             pass  # Ignore cleanup errors in test teardown
 
 
-@pytest.mark.asyncio
 async def test_stop_and_remove_container():
     """Test stopping and removing a container."""
     manager = ContainerManager()
@@ -89,7 +88,6 @@ async def test_stop_and_remove_container():
         await manager.get_container(container.id)
 
 
-@pytest.mark.asyncio
 async def test_get_container_by_id_and_alias():
     """Test getting container by ID and alias."""
     manager = ContainerManager()
@@ -117,7 +115,6 @@ async def test_get_container_by_id_and_alias():
             pass  # Ignore cleanup errors in test teardown
 
 
-@pytest.mark.asyncio
 async def test_list_containers():
     """Test listing containers."""
     manager = ContainerManager()
@@ -155,7 +152,6 @@ async def test_list_containers():
             pass  # Ignore cleanup errors in test teardown
 
 
-@pytest.mark.asyncio
 async def test_container_not_found_errors():
     """Test that operations on non-existent containers raise appropriate errors."""
     manager = ContainerManager()
@@ -3,13 +3,10 @@
 from datetime import datetime
 from uuid import uuid4
 
-import pytest
-
 from mcp_devbench.models.containers import Container
 from mcp_devbench.repositories.containers import ContainerRepository
 
 
-@pytest.mark.asyncio
 async def test_create_container(db_session):
     """Test creating a container."""
     repo = ContainerRepository(db_session)
@@ -32,7 +29,6 @@ async def test_create_container(db_session):
     assert created.status == "running"
 
 
-@pytest.mark.asyncio
 async def test_get_container_by_id(db_session):
     """Test getting a container by ID."""
     repo = ContainerRepository(db_session)
@@ -54,7 +50,6 @@ async def test_get_container_by_id(db_session):
     assert retrieved.id == container.id
 
 
-@pytest.mark.asyncio
 async def test_get_container_by_alias(db_session):
     """Test getting a container by alias."""
     repo = ContainerRepository(db_session)
@@ -77,7 +72,6 @@ async def test_get_container_by_alias(db_session):
     assert retrieved.alias == "my-alias"
 
 
-@pytest.mark.asyncio
 async def test_get_container_by_identifier(db_session):
     """Test getting a container by ID or alias."""
     repo = ContainerRepository(db_session)
@@ -106,7 +100,6 @@ async def test_get_container_by_identifier(db_session):
     assert retrieved.alias == "my-alias"
 
 
-@pytest.mark.asyncio
 async def test_update_container_status(db_session):
     """Test updating container status."""
     repo = ContainerRepository(db_session)
@@ -128,7 +121,34 @@ async def test_update_container_status(db_session):
     assert updated.status == "stopped"
 
 
-@pytest.mark.asyncio
+async def test_update_status_bulk(db_session):
+    """Test updating the status of several containers at once."""
+    repo = ContainerRepository(db_session)
+
+    containers = [
+        Container(
+            id=f"c_{uuid4()}",
+            docker_id=f"docker_{uuid4()}",
+            image="python:3.11",
+            persistent=False,
+            created_at=datetime.utcnow(),
+            last_seen=datetime.utcnow(),
+            status="running",
+        )
+        for _ in range(3)
+    ]
+    for container in containers:
+        await repo.create(container)
+
+    updated = await repo.update_status_bulk([c.id for c in containers[:2]], "stopped")
+    assert updated == 2
+
+    statuses = [(await repo.get(c.id)).status for c in containers]
+    assert statuses == ["stopped", "stopped", "running"]
+
+    assert await repo.update_status_bulk([], "stopped") == 0
+
+
 async def test_list_containers_by_status(db_session):
     """Test listing containers by status."""
     repo = ContainerRepository(db_session)
@@ -167,7 +187,6 @@ async def test_list_containers_by_status(db_session):
     assert len(all_containers) == 2
 
 
-@pytest.mark.asyncio
 async def test_delete_container(db_session):
     """Test deleting a container."""
     repo = ContainerRepository(db_session)
@@ -40,7 +40,6 @@ def mock_exec_entry():
     return exec_entry
 
 
-@pytest.mark.asyncio
 async def test_execute_creates_exec_entry(db_session, mock_container):
     """Test that execute creates an exec entry in the database."""
     with (
@@ -90,7 +89,6 @@ async def test_execute_creates_exec_entry(db_session, mock_container):
         assert exec_entry.as_root is False
 
 
-@pytest.mark.asyncio
 async def test_execute_with_nonexistent_container(db_session):
     """Test that execute raises error for nonexistent container."""
     with (
@@ -113,7 +111,6 @@ async def test_execute_with_nonexistent_container(db_session):
         assert exc_info.value.identifier == "c_nonexistent"
 
 
-@pytest.mark.asyncio
 async def test_execute_with_as_root(db_session):
     """Test execute with as_root flag."""
     with (
@@ -155,7 +152,6 @@ async def test_execute_with_as_root(db_session):
         assert exec_entry.as_root is True
 
 
-@pytest.mark.asyncio
 async def test_get_exec_result(db_session):
     """Test getting exec result."""
     with (
@@ -190,7 +186,6 @@ async def test_get_exec_result(db_session):
         assert result.usage["wall_ms"] == 100
 
 
-@pytest.mark.asyncio
 async def test_get_exec_result_not_found(db_session):
     """Test getting result for nonexistent exec."""
     with (
@@ -210,7 +205,6 @@ async def test_get_exec_result_not_found(db_session):
         assert exc_info.value.exec_id == "e_nonexistent"
 
 
-@pytest.mark.asyncio
 async def test_get_active_execs(db_session):
     """Test getting active execs for a container."""
     with (
@@ -253,7 +247,6 @@ async def test_get_active_execs(db_session):
         assert active_execs[0].exec_id == "e_active"
 
 
-@pytest.mark.asyncio
 async def test_cleanup_old_execs(db_session):
     """Test cleaning up old completed execs."""
     with (
@@ -292,8 +285,7 @@ async def test_cleanup_old_execs(db_session):
         assert result is None
 
 
-@pytest.mark.asyncio
-async def test_semaphore_limits_concurrent_execs():
+def test_semaphore_limits_concurrent_execs():
     """Test that semaphore limits concurrent executions per container."""
     with patch("mcp_devbench.managers.exec_manager.get_docker_client"):
         manager = ExecManager()
@@ -313,7 +305,6 @@ async def test_semaphore_limits_concurrent_execs():
         assert sem1._value == ExecManager.MAX_CONCURRENT_EXECS
 
 
-@pytest.mark.asyncio
 async def test_idempotency_key(db_session):
     """Test idempotency key prevents duplicate execution."""
     with (
@@ -360,7 +351,6 @@ async def test_idempotency_key(db_session):
         assert exec_id1 == exec_id2
 
 
-@pytest.mark.asyncio
 async def test_cancel_exec(db_session):
     """Test cancelling an execution."""
     with (
@@ -392,7 +382,6 @@ async def test_cancel_exec(db_session):
         assert manager._cancelled.get("e_test123") is True
 
 
-@pytest.mark.asyncio
 async def test_cancel_nonexistent_exec(db_session):
     """Test cancelling a nonexistent exec raises error."""
     with (
@@ -412,7 +401,6 @@ async def test_cancel_nonexistent_exec(db_session):
         assert exc_info.value.exec_id == "e_nonexistent"
 
 
-@pytest.mark.asyncio
 async def test_cleanup_idempotency_keys():
     """Test cleaning up expired idempotency keys."""
     with patch("mcp_devbench.managers.exec_manager.get_docker_client"):
@@ -1,11 +1,22 @@
 """Unit tests for FilesystemManager."""
 
-from unittest.mock import MagicMock, patch
+import asyncio
+import hashlib
+import io
+import re
+import tarfile
+from datetime import datetime
+from typing import Final
+from unittest.mock import MagicMock, call, patch
 
 import pytest
+from docker import DockerClient
+from docker.errors import NotFound
+from docker.models.containers import Container, ExecResult
 
 from mcp_devbench.managers.filesystem_manager import (
     BatchOperation,
+    FileInfo,
     FilesystemManager,
     OperationType,
 )
@@ -17,63 +28,112 @@ from mcp_devbench.utils.exceptions import (
 )
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def mock_docker_client():
-    """Create mock Docker client."""
-    client = MagicMock()
+    """Create mock Docker client shared across tests."""
+    client = MagicMock(spec=DockerClient)
+    client.containers = MagicMock()
+    client.api = MagicMock()
     return client
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def mock_container():
-    """Create mock container."""
-    container = MagicMock()
+    """Create mock container shared across tests."""
+    container = MagicMock(spec=Container)
     container.id = "docker123"
     return container
 
 
-@pytest.fixture
+@pytest.fixture(autouse=True)
+def reset_mocks(mock_docker_client, mock_container):
+    """Reset shared mocks so no configuration leaks between tests."""
+    yield
+    mock_docker_client.reset_mock(return_value=True, side_effect=True)
+    mock_container.reset_mock(return_value=True, side_effect=True)
+
+
+def _shell_command(args) -> str:
+    """Return the command an exec_run call runs, unwrapping ``sh -c``."""
+    cmd = args[0]
+    return cmd[-1] if cmd[0] == "sh" else cmd[0]
+
+
+_VALIDATE_CASES: Final = (
+    ("/workspace/test.txt", "/workspace/test.txt"),
+    ("test.txt", "/workspace/test.txt"),
+    ("/workspace/./subdir/./test.txt", "/workspace/subdir/test.txt"),
+)
+_ESCAPE_CASES: Final = ("/workspace/../etc/passwd", "/etc/passwd")
+
+_HELLO_ETAG = hashlib.md5(b"Hello, World!").hexdigest()
+_HELLO_STAT_ETAG = hashlib.sha256(b"/workspace/test.txt:13:1609459200").hexdigest()
+
+_OK = ExecResult(0, b"")
+_FAIL = ExecResult(1, b"")
+_IS_DIR = ExecResult(0, b"yes")
+_IS_NOT_DIR = ExecResult(0, b"no")
+
+
+def _ok(output: bytes) -> ExecResult:
+    """Build a successful exec result."""
+    return ExecResult(0, output)
+
+
+def _streamed(*chunks: bytes) -> ExecResult:
+    """Build a streamed exec result (no exit code, chunk iterator)."""
+    return ExecResult(None, iter(chunks))
+
+
+def _cat(client, *chunks: bytes, exit_code: int = 0) -> None:
+    """Serve streamed ``cat`` reads through the client's low-level exec API."""
+    client.api.exec_create.return_value = {"Id": "exec123"}
+    client.api.exec_start.side_effect = lambda *args, **kwargs: iter(chunks)
+    client.api.exec_inspect.return_value = {"ExitCode": exit_code}
+
+
+def _cmd_dispatcher(table: dict[str, ExecResult]):
+    """Build an exec_run side effect answering by command prefix.
+
+    Commands matching no prefix fail, so tests do not depend on the order in
+    which the manager issues them.
+    """
+
+    def side_effect(*args, **kwargs):
+        shell = _shell_command(args)
+        for prefix, result in table.items():
+            if shell.startswith(prefix):
+                return result
+        return _FAIL
+
+    return side_effect
+
+
+@pytest.fixture(scope="session")
 def filesystem_manager(mock_docker_client):
-    """Create FilesystemManager with mocked Docker client."""
+    """Create FilesystemManager with mocked Docker client, once per session."""
     with patch("mcp_devbench.managers.filesystem_manager.get_docker_client") as mock:
         mock.return_value = mock_docker_client
         manager = FilesystemManager()
         return manager
 
 
-@pytest.mark.asyncio
 class TestPathValidation:
     """Tests for path validation."""
 
-    async def test_validate_absolute_path(self, filesystem_manager):
-        """Test validation of absolute paths."""
-        path = filesystem_manager._validate_path("/workspace/test.txt")
-        assert path == "/workspace/test.txt"
-
-    async def test_validate_relative_path(self, filesystem_manager):
-        """Test validation of relative paths."""
-        path = filesystem_manager._validate_path("test.txt")
-        assert path == "/workspace/test.txt"
-
-    async def test_reject_parent_directory_escape(self, filesystem_manager):
-        """Test rejection of paths trying to escape with .."""
-        with pytest.raises(PathSecurityError) as exc_info:
-            filesystem_manager._validate_path("/workspace/../etc/passwd")
-        assert "must be under /workspace" in str(exc_info.value)
+    @pytest.mark.parametrize(("raw", "expected"), _VALIDATE_CASES)
+    def test_validate_path(self, filesystem_manager, raw, expected):
+        """Test paths are normalized under /workspace."""
+        assert filesystem_manager._validate_path(raw) == expected
 
-    async def test_reject_direct_escape(self, filesystem_manager):
-        """Test rejection of paths outside workspace."""
+    @pytest.mark.parametrize("raw", _ESCAPE_CASES)
+    def test_reject_escape(self, filesystem_manager, raw):
+        """Test paths outside /workspace are rejected."""
         with pytest.raises(PathSecurityError) as exc_info:
-            filesystem_manager._validate_path("/etc/passwd")
+            filesystem_manager._validate_path(raw)
         assert "must be under /workspace" in str(exc_info.value)
 
-    async def test_normalize_path_with_dots(self, filesystem_manager):
-        """Test normalization of paths with . components."""
-        path = filesystem_manager._validate_path("/workspace/./subdir/./test.txt")
-        assert path == "/workspace/subdir/test.txt"
 
-
-@pytest.mark.asyncio
 class TestReadOperation:
     """Tests for read operation."""
 
@@ -82,26 +142,13 @@ class TestReadOperation:
         # Setup mocks
         mock_docker_client.containers.get.return_value = mock_container
 
-        # Mock stat command output
-        stat_output = MagicMock()
-        stat_output.exit_code = 0
-        stat_output.output = b"13|644|1609459200"  # size|perms|mtime
-
-        # Mock read command output
-        read_output = MagicMock()
-        read_output.exit_code = 0
-        read_output.output = b"Hello, World!"
-
-        # Mock is_dir check
-        is_dir_output = MagicMock()
-        is_dir_output.exit_code = 0
-        is_dir_output.output = b"no"
-
-        mock_container.exec_run.side_effect = [
-            stat_output,
-            read_output,
-            is_dir_output,
-        ]
+        mock_container.exec_run.side_effect = _cmd_dispatcher(
+            {
+                "stat ": _ok(b"13|644|1609459200"),  # size|perms|mtime
+                "test -d": _IS_NOT_DIR,
+            }
+        )
+        _cat(mock_docker_client, b"Hello, World!")
 
         # Execute
         content, file_info = await filesystem_manager.read("c_test123", "test.txt")
@@ -112,8 +159,7 @@ class TestReadOperation:
         assert file_info.size == 13
         assert file_info.is_dir is False
         assert file_info.permissions == "644"
-        assert isinstance(file_info.etag, str)
-        assert len(file_info.etag) == 64  # SHA-256 hash
+        assert file_info.etag == _HELLO_ETAG
 
     async def test_read_nonexistent_file(
         self, filesystem_manager, mock_docker_client, mock_container
@@ -122,21 +168,102 @@ class TestReadOperation:
         # Setup mocks
         mock_docker_client.containers.get.return_value = mock_container
 
-        stat_output = MagicMock()
-        stat_output.exit_code = 1
-        mock_container.exec_run.return_value = stat_output
+        mock_container.exec_run.return_value = _FAIL
 
         # Execute and verify
         with pytest.raises(FileNotFoundError):
             await filesystem_manager.read("c_test123", "nonexistent.txt")
 
+    async def test_read_streams_chunks(
+        self, filesystem_manager, mock_docker_client, mock_container
+    ):
+        """Test read joins streamed chunks without a buffered exec."""
+        mock_docker_client.containers.get.return_value = mock_container
+
+        mock_container.exec_run.side_effect = _cmd_dispatcher(
+            {
+                "stat ": _ok(b"12|644|1609459200"),
+                "test -d": _IS_NOT_DIR,
+            }
+        )
+        _cat(mock_docker_client, b"chunk1", b"", b"chunk2")
+
+        content, file_info = await filesystem_manager.read("c_test123", "test.txt")
+
+        assert content == b"chunk1chunk2"
+        assert file_info.etag == filesystem_manager._calculate_etag(content)
+        mock_docker_client.api.exec_create.assert_called_once_with(
+            "docker123", ["cat", "/workspace/test.txt"], stdout=True, stderr=False, user="1000:1000"
+        )
+
+    async def test_read_through_symlink(
+        self, filesystem_manager, mock_docker_client, mock_container
+    ):
+        """Test a symlinked file reads the target's content, size and mode."""
+        mock_docker_client.containers.get.return_value = mock_container
+
+        def exec_side_effect(*args, **kwargs):
+            shell = _shell_command(args)
+            if shell.startswith("stat -L "):
+                return _ok(b"13|644|1609459200")  # the target, not the 9-byte link
+            if shell.startswith("test -d"):
+                return _IS_NOT_DIR
+            return _FAIL
+
+        mock_container.exec_run.side_effect = exec_side_effect
+        _cat(mock_docker_client, b"Hello, World!")
+
+        content, file_info = await filesystem_manager.read("c_test123", "link.txt")
+
+        assert content == b"Hello, World!"
+        assert file_info.size == 13
+        assert file_info.permissions == "644"
+
+    async def test_read_file_growing_since_stat(
+        self, filesystem_manager, mock_docker_client, mock_container
+    ):
+        """Test a file appended to between stat and cat is still read successfully."""
+        mock_docker_client.containers.get.return_value = mock_container
+
+        mock_container.exec_run.side_effect = _cmd_dispatcher(
+            {"stat ": _ok(b"5|644|1609459200"), "test -d": _IS_NOT_DIR}
+        )
+        _cat(mock_docker_client, b"line1", b"line2")
+
+        content, _ = await filesystem_manager.read("c_test123", "build.log")
+
+        assert content == b"line1line2"
+
+    async def test_read_directory(self, filesystem_manager, mock_docker_client, mock_container):
+        """Test reading a directory raises FileNotFoundError."""
+        mock_docker_client.containers.get.return_value = mock_container
+
+        mock_container.exec_run.side_effect = _cmd_dispatcher(
+            {"stat ": _ok(b"4096|755|1609459200"), "test -d": _IS_DIR}
+        )
+
+        with pytest.raises(FileNotFoundError):
+            await filesystem_manager.read("c_test123", "subdir")
+
+    async def test_read_failed_cat(self, filesystem_manager, mock_docker_client, mock_container):
+        """Test a cat that exits non-zero is not a successful read."""
+        mock_docker_client.containers.get.return_value = mock_container
+
+        # File vanished (or became unreadable) between stat and cat
+        mock_container.exec_run.side_effect = _cmd_dispatcher(
+            {"stat ": _ok(b"13|644|1609459200"), "test -d": _IS_NOT_DIR}
+        )
+        _cat(mock_docker_client, exit_code=1)
+
+        with pytest.raises(FileNotFoundError):
+            await filesystem_manager.read("c_test123", "test.txt")
+
     async def test_read_with_invalid_path(self, filesystem_manager):
         """Test reading with invalid path."""
         with pytest.raises(PathSecurityError):
             await filesystem_manager.read("c_test123", "/etc/passwd")
 
 
-@pytest.mark.asyncio
 class TestWriteOperation:
     """Tests for write operation."""
 
@@ -145,27 +272,16 @@ class TestWriteOperation:
         # Setup mocks
         mock_docker_client.containers.get.return_value = mock_container
 
-        # Mock write command
-        write_output = MagicMock()
-        write_output.exit_code = 0
-
-        # Mock stat command for etag calculation
-        stat_output = MagicMock()
-        stat_output.exit_code = 0
-        stat_output.output = b"1609459200"  # mtime
-
-        mock_container.exec_run.side_effect = [
-            write_output,
-            stat_output,
-        ]
-
         # Execute
         content = b"Hello, World!"
         etag = await filesystem_manager.write("c_test123", "test.txt", content)
 
         # Verify
-        assert isinstance(etag, str)
-        assert len(etag) == 64  # SHA-256 hash
+        assert etag == _HELLO_ETAG
+
+        # Unconditional write at the workspace root needs no exec preflight
+        mock_container.exec_run.assert_not_called()
+        mock_container.put_archive.assert_called_once()
 
     async def test_write_with_parent_directory_creation(
         self, filesystem_manager, mock_docker_client, mock_container
@@ -174,54 +290,27 @@ class TestWriteOperation:
         # Setup mocks
         mock_docker_client.containers.get.return_value = mock_container
 
-        mkdir_output = MagicMock()
-        mkdir_output.exit_code = 0
-
-        write_output = MagicMock()
-        write_output.exit_code = 0
-
-        stat_output = MagicMock()
-        stat_output.exit_code = 0
-        stat_output.output = b"1609459200"
-
-        mock_container.exec_run.side_effect = [
-            mkdir_output,
-            write_output,
-            stat_output,
-        ]
+        mock_container.exec_run.side_effect = _cmd_dispatcher({"mkdir -p": _OK})
 
         # Execute
         content = b"test"
         await filesystem_manager.write("c_test123", "subdir/test.txt", content)
 
-        # Verify mkdir was called
-        calls = mock_container.exec_run.call_args_list
-        assert any("mkdir -p" in str(call) for call in calls)
+        # Verify mkdir was called for the parent directory
+        mock_container.exec_run.assert_called_once_with(
+            ["sh", "-c", "mkdir -p /workspace/subdir"], user="1000:1000"
+        )
 
     async def test_write_with_etag_mismatch(
         self, filesystem_manager, mock_docker_client, mock_container
     ):
         """Test write fails with mismatched ETag."""
-        # Setup mocks for read operation
+        # Setup mocks for etag check
         mock_docker_client.containers.get.return_value = mock_container
 
-        stat_output = MagicMock()
-        stat_output.exit_code = 0
-        stat_output.output = b"5|644|1609459200"
-
-        read_output = MagicMock()
-        read_output.exit_code = 0
-        read_output.output = b"hello"
-
-        is_dir_output = MagicMock()
-        is_dir_output.exit_code = 0
-        is_dir_output.output = b"no"
-
-        mock_container.exec_run.side_effect = [
-            stat_output,
-            read_output,
-            is_dir_output,
-        ]
+        mock_container.exec_run.side_effect = _cmd_dispatcher(
+            {"md5sum": _ok(b"5d41402abc4b2a76b9719d911017c592  -\n")}
+        )
 
         # Execute and verify
         with pytest.raises(FileConflictError):
@@ -229,8 +318,42 @@ class TestWriteOperation:
                 "c_test123", "test.txt", b"new content", if_match_etag="wrong_etag"
             )
 
+        # Only the hash crosses the wire, not the file body
+        mock_container.exec_run.assert_called_once_with(
+            ["sh", "-c", "md5sum < /workspace/test.txt"], user="1000:1000"
+        )
+
+    async def test_etag_of_name_with_backslash(self, filesystem_manager, mock_container):
+        """Test ETag preflight hashes stdin, so md5sum never escapes the name."""
+        mock_container.exec_run.return_value = _ok(b"5d41402abc4b2a76b9719d911017c592  -\n")
+
+        etag = await filesystem_manager._etag(mock_container, "/workspace/a\\b")
+
+        assert etag == "5d41402abc4b2a76b9719d911017c592"
+        mock_container.exec_run.assert_called_once_with(
+            ["sh", "-c", "md5sum < '/workspace/a\\b'"], user="1000:1000"
+        )
+
+    async def test_write_with_etag_match(
+        self, filesystem_manager, mock_docker_client, mock_container
+    ):
+        """Test write succeeds with matching ETag."""
+        mock_docker_client.containers.get.return_value = mock_container
+
+        mock_container.exec_run.side_effect = _cmd_dispatcher(
+            {"md5sum": _ok(b"5d41402abc4b2a76b9719d911017c592  -\n")}
+        )
+
+        etag = await filesystem_manager.write(
+            "c_test123",
+            "test.txt",
+            b"new content",
+            if_match_etag="5d41402abc4b2a76b9719d911017c592",
+        )
+
+        assert etag == filesystem_manager._calculate_etag(b"new content")
+
 
-@pytest.mark.asyncio
 class TestDeleteOperation:
     """Tests for delete operation."""
 
@@ -241,17 +364,15 @@ class TestDeleteOperation:
         # Setup mocks
         mock_docker_client.containers.get.return_value = mock_container
 
-        delete_output = MagicMock()
-        delete_output.exit_code = 0
-        mock_container.exec_run.return_value = delete_output
+        mock_container.exec_run.return_value = _OK
 
         # Execute
         await filesystem_manager.delete("c_test123", "test.txt")
 
         # Verify rm command was called
-        mock_container.exec_run.assert_called_once()
-        call_args = mock_container.exec_run.call_args
-        assert "rm -rf" in str(call_args)
+        mock_container.exec_run.assert_called_once_with(
+            ["sh", "-c", "rm -rf /workspace/test.txt"], user="1000:1000"
+        )
 
     async def test_delete_nonexistent_file(
         self, filesystem_manager, mock_docker_client, mock_container
@@ -260,15 +381,8 @@ class TestDeleteOperation:
         # Setup mocks
         mock_docker_client.containers.get.return_value = mock_container
 
-        # rm fails
-        delete_output = MagicMock()
-        delete_output.exit_code = 1
-
-        # test -e also fails (file doesn't exist)
-        test_output = MagicMock()
-        test_output.exit_code = 1
-
-        mock_container.exec_run.side_effect = [delete_output, test_output]
+        # rm fails, and so does the test -e existence probe
+        mock_container.exec_run.return_value = _FAIL
 
         # Execute and verify
         with pytest.raises(FileNotFoundError):
@@ -281,7 +395,6 @@ class TestDeleteOperation:
         assert "Cannot delete workspace root" in str(exc_info.value)
 
 
-@pytest.mark.asyncio
 class TestStatOperation:
     """Tests for stat operation."""
 
@@ -290,30 +403,9 @@ class TestStatOperation:
         # Setup mocks
         mock_docker_client.containers.get.return_value = mock_container
 
-        # Mock stat command
-        stat_output = MagicMock()
-        stat_output.exit_code = 0
-        stat_output.output = b"13|644|1609459200|regular file"
-
-        # Mock read for etag (called by stat for files)
-        read_stat_output = MagicMock()
-        read_stat_output.exit_code = 0
-        read_stat_output.output = b"13|644|1609459200"
-
-        read_output = MagicMock()
-        read_output.exit_code = 0
-        read_output.output = b"Hello, World!"
-
-        is_dir_output = MagicMock()
-        is_dir_output.exit_code = 0
-        is_dir_output.output = b"no"
-
-        mock_container.exec_run.side_effect = [
-            stat_output,
-            read_stat_output,
-            read_output,
-            is_dir_output,
-        ]
+        mock_container.exec_run.side_effect = _cmd_dispatcher(
+            {"stat ": _ok(b"13|644|1609459200|regular file")}
+        )
 
         # Execute
         file_info = await filesystem_manager.stat("c_test123", "test.txt")
@@ -323,17 +415,14 @@ class TestStatOperation:
         assert file_info.size == 13
         assert file_info.is_dir is False
         assert file_info.permissions == "644"
-        assert isinstance(file_info.etag, str)
+        assert file_info.etag == _HELLO_STAT_ETAG
 
     async def test_stat_directory(self, filesystem_manager, mock_docker_client, mock_container):
         """Test getting stats for directory."""
         # Setup mocks
         mock_docker_client.containers.get.return_value = mock_container
 
-        stat_output = MagicMock()
-        stat_output.exit_code = 0
-        stat_output.output = b"4096|755|1609459200|directory"
-        mock_container.exec_run.return_value = stat_output
+        mock_container.exec_run.return_value = _ok(b"4096|755|1609459200|directory")
 
         # Execute
         file_info = await filesystem_manager.stat("c_test123", "subdir")
@@ -343,7 +432,6 @@ class TestStatOperation:
         assert file_info.is_dir is True
 
 
-@pytest.mark.asyncio
 class TestListOperation:
     """Tests for list operation."""
 
@@ -352,14 +440,11 @@ class TestListOperation:
         # Setup mocks
         mock_docker_client.containers.get.return_value = mock_container
 
-        list_output = MagicMock()
-        list_output.exit_code = 0
-        list_output.output = (
+        mock_container.exec_run.return_value = _ok(
             b"/workspace/file1.txt|100|644|1609459200.0|f\n"
             b"/workspace/file2.py|200|644|1609459200.0|f\n"
             b"/workspace/subdir|4096|755|1609459200.0|d\n"
         )
-        mock_container.exec_run.return_value = list_output
 
         # Execute
         files = await filesystem_manager.list("c_test123", "/workspace")
@@ -369,8 +454,12 @@ class TestListOperation:
         assert files[0].path == "/workspace/file1.txt"
         assert files[0].size == 100
         assert files[0].is_dir is False
+        assert files[0].permissions == "644"
+        assert files[1].mime_type == "text/x-python"
         assert files[2].path == "/workspace/subdir"
         assert files[2].is_dir is True
+        assert files[2].size == 0
+        assert files[2].mime_type is None
 
     async def test_list_empty_directory(
         self, filesystem_manager, mock_docker_client, mock_container
@@ -379,10 +468,7 @@ class TestListOperation:
         # Setup mocks
         mock_docker_client.containers.get.return_value = mock_container
 
-        list_output = MagicMock()
-        list_output.exit_code = 0
-        list_output.output = b""
-        mock_container.exec_run.return_value = list_output
+        mock_container.exec_run.return_value = _ok(b"")
 
         # Execute
         files = await filesystem_manager.list("c_test123", "/workspace")
@@ -397,15 +483,8 @@ class TestListOperation:
         # Setup mocks
         mock_docker_client.containers.get.return_value = mock_container
 
-        # find fails
-        list_output = MagicMock()
-        list_output.exit_code = 1
-
-        # test -d also fails
-        test_output = MagicMock()
-        test_output.exit_code = 1
-
-        mock_container.exec_run.side_effect = [list_output, test_output]
+        # find fails, and so does the test -d existence probe
+        mock_container.exec_run.return_value = _FAIL
 
         # Execute and verify
         with pytest.raises(FileNotFoundError):
@@ -415,28 +494,20 @@ class TestListOperation:
 class TestMimeTypeGuessing:
     """Tests for MIME type guessing."""
 
-    def test_guess_text_mime_type(self, filesystem_manager):
-        """Test guessing MIME type for text files."""
-        mime = filesystem_manager._guess_mime_type("test.txt")
-        assert mime == "text/plain"
-
-    def test_guess_python_mime_type(self, filesystem_manager):
-        """Test guessing MIME type for Python files."""
-        mime = filesystem_manager._guess_mime_type("script.py")
-        assert mime == "text/x-python"
-
-    def test_guess_json_mime_type(self, filesystem_manager):
-        """Test guessing MIME type for JSON files."""
-        mime = filesystem_manager._guess_mime_type("data.json")
-        assert mime == "application/json"
+    @pytest.mark.parametrize(
+        ("path", "expected"),
+        [
+            ("test.txt", "text/plain"),
+            ("script.py", "text/x-python"),
+            ("data.json", "application/json"),
+            ("file.xyz", "application/octet-stream"),
+        ],
+    )
+    def test_guess_mime_type(self, filesystem_manager, path, expected):
+        """Test MIME type guessing by file extension."""
+        assert filesystem_manager._guess_mime_type(path) == expected
 
-    def test_guess_unknown_mime_type(self, filesystem_manager):
-        """Test guessing MIME type for unknown files."""
-        mime = filesystem_manager._guess_mime_type("file.xyz")
-        assert mime == "application/octet-stream"
 
-
-@pytest.mark.asyncio
 class TestContainerNotFound:
     """Tests for container not found errors."""
 
@@ -444,8 +515,6 @@ class TestContainerNotFound:
         self, filesystem_manager, mock_docker_client
     ):
         """Test operations fail with nonexistent container."""
-        from docker.errors import NotFound
-
         mock_docker_client.containers.get.side_effect = NotFound("Container not found")
 
         with pytest.raises(ContainerNotFoundError):
@@ -464,7 +533,6 @@ class TestContainerNotFound:
             await filesystem_manager.list("c_nonexistent", "/workspace")
 
 
-@pytest.mark.asyncio
 class TestBatchOperations:
     """Tests for batch operations."""
 
@@ -476,33 +544,15 @@ class TestBatchOperations:
 
         # Setup mocks for read operations
         def exec_side_effect(*args, **kwargs):
-            cmd = args[0]
-            if "stat" in str(cmd):
-                result = MagicMock()
-                result.exit_code = 0
-                result.output = b"13|644|1609459200"
-                return result
-            elif "cat" in str(cmd):
-                result = MagicMock()
-                result.exit_code = 0
-                result.output = b"test content"
-                return result
-            elif "test -d" in str(cmd):
-                result = MagicMock()
-                result.exit_code = 0
-                result.output = b"no"
-                return result
-            elif "mkdir" in str(cmd):
-                result = MagicMock()
-                result.exit_code = 0
-                return result
-            elif "rm -rf" in str(cmd):
-                result = MagicMock()
-                result.exit_code = 0
-                return result
-            return MagicMock(exit_code=0)
+            shell = _shell_command(args)
+            if shell.startswith("stat "):
+                return _ok(b"12|644|1609459200")
+            elif shell.startswith("test -d"):
+                return _IS_NOT_DIR
+            return _OK
 
         mock_container.exec_run.side_effect = exec_side_effect
+        _cat(mock_docker_client, b"test content")
 
         # Execute batch
         operations = [
@@ -517,6 +567,25 @@ class TestBatchOperations:
         assert all(r.success for r in result.results)
         assert result.results[0].data["content"] == b"test content"
 
+    async def test_batch_staging_dirs_are_unique(
+        self, filesystem_manager, mock_docker_client, mock_container
+    ):
+        """Test each batch stages under its own random /tmp/mcp_batch_<hex> directory."""
+        mock_docker_client.containers.get.return_value = mock_container
+        mock_container.exec_run.return_value = _OK
+
+        await filesystem_manager.batch("c_test123", [])
+        await filesystem_manager.batch("c_test123", [])
+
+        staging_dirs = [
+            _shell_command(c.args).removeprefix("mkdir -p ")
+            for c in mock_container.exec_run.call_args_list
+            if _shell_command(c.args).startswith("mkdir -p ")
+        ]
+        assert len(staging_dirs) == 2
+        assert staging_dirs[0] != staging_dirs[1]
+        assert all(re.fullmatch(r"/tmp/mcp_batch_[0-9a-f]{8}", d) for d in staging_dirs)
+
     async def test_batch_write_operations(
         self, filesystem_manager, mock_docker_client, mock_container
     ):
@@ -526,27 +595,11 @@ class TestBatchOperations:
         write_count = [0]
 
         def exec_side_effect(*args, **kwargs):
-            cmd = args[0]
-            if "stat -c '%s|%a|%Y'" in str(cmd):
+            shell = _shell_command(args)
+            if shell.startswith("stat -L -c '%s|%a|%Y'"):
                 # For checking if file exists before write (for rollback)
-                result = MagicMock()
-                result.exit_code = 1  # File doesn't exist yet
-                return result
-            elif "stat -c '%Y'" in str(cmd):
-                # For getting mtime after write
-                result = MagicMock()
-                result.exit_code = 0
-                result.output = b"1609459200"
-                return result
-            elif "mkdir" in str(cmd):
-                result = MagicMock()
-                result.exit_code = 0
-                return result
-            elif "rm -rf" in str(cmd):
-                result = MagicMock()
-                result.exit_code = 0
-                return result
-            return MagicMock(exit_code=0)
+                return _FAIL
+            return _OK
 
         mock_container.exec_run.side_effect = exec_side_effect
 
@@ -577,53 +630,19 @@ class TestBatchOperations:
         mock_docker_client.containers.get.return_value = mock_container
 
         def exec_side_effect(*args, **kwargs):
-            cmd = args[0]
-            if "stat -c '%s|%a|%Y'" in str(cmd) and "file1.txt" in str(cmd):
+            shell = _shell_command(args)
+            if shell.startswith("stat -L -c '%s|%a|%Y'") and shell.endswith("/file1.txt"):
                 # Read operation for file1.txt
-                result = MagicMock()
-                result.exit_code = 0
-                result.output = b"13|644|1609459200"
-                return result
-            elif "cat" in str(cmd):
-                result = MagicMock()
-                result.exit_code = 0
-                result.output = b"test content"
-                return result
-            elif "test -d" in str(cmd):
-                result = MagicMock()
-                result.exit_code = 0
-                result.output = b"no"
-                return result
-            elif "base64 -d" in str(cmd):
-                result = MagicMock()
-                result.exit_code = 0
-                return result
-            elif "stat -c '%s|%a|%Y'" in str(cmd) and "file2.txt" in str(cmd):
-                # Check before write - file doesn't exist
-                result = MagicMock()
-                result.exit_code = 1
-                return result
-            elif "stat -c '%s|%a|%Y'" in str(cmd) and "file3.txt" in str(cmd):
-                # Check before delete - file doesn't exist
-                result = MagicMock()
-                result.exit_code = 1
-                return result
-            elif "stat -c '%Y'" in str(cmd):
-                result = MagicMock()
-                result.exit_code = 0
-                result.output = b"1609459200"
-                return result
-            elif "rm -rf" in str(cmd):
-                result = MagicMock()
-                result.exit_code = 0
-                return result
-            elif "mkdir" in str(cmd):
-                result = MagicMock()
-                result.exit_code = 0
-                return result
-            return MagicMock(exit_code=0)
+                return _ok(b"12|644|1609459200")
+            elif shell.startswith("test -d"):
+                return _IS_NOT_DIR
+            elif shell.startswith("stat -L -c '%s|%a|%Y'"):
+                # Check before write/delete of file2.txt/file3.txt - file doesn't exist
+                return _FAIL
+            return _OK
 
         mock_container.exec_run.side_effect = exec_side_effect
+        _cat(mock_docker_client, b"test content")
 
         # Execute batch
         operations = [
@@ -645,37 +664,15 @@ class TestBatchOperations:
         mock_docker_client.containers.get.return_value = mock_container
 
         def exec_side_effect(*args, **kwargs):
-            cmd = args[0]
-            if "stat" in str(cmd):
-                result = MagicMock()
-                result.exit_code = 0
-                result.output = b"13|644|1609459200"
-                return result
-            elif "cat" in str(cmd):
-                result = MagicMock()
-                result.exit_code = 0
-                result.output = b"source content"
-                return result
-            elif "test -d" in str(cmd):
-                result = MagicMock()
-                result.exit_code = 0
-                result.output = b"no"
-                return result
-            elif "base64 -d" in str(cmd):
-                result = MagicMock()
-                result.exit_code = 0
-                return result
-            elif "mkdir" in str(cmd):
-                result = MagicMock()
-                result.exit_code = 0
-                return result
-            elif "rm -rf" in str(cmd):
-                result = MagicMock()
-                result.exit_code = 0
-                return result
-            return MagicMock(exit_code=0)
+            shell = _shell_command(args)
+            if shell.startswith("stat "):
+                return _ok(b"14|644|1609459200")
+            elif shell.startswith("test -d"):
+                return _IS_NOT_DIR
+            return _OK
 
         mock_container.exec_run.side_effect = exec_side_effect
+        _cat(mock_docker_client, b"source content")
 
         # Execute batch
         operations = [
@@ -700,37 +697,15 @@ class TestBatchOperations:
         mock_docker_client.containers.get.return_value = mock_container
 
         def exec_side_effect(*args, **kwargs):
-            cmd = args[0]
-            if "stat" in str(cmd):
-                result = MagicMock()
-                result.exit_code = 0
-                result.output = b"13|644|1609459200"
-                return result
-            elif "cat" in str(cmd):
-                result = MagicMock()
-                result.exit_code = 0
-                result.output = b"source content"
-                return result
-            elif "test -d" in str(cmd):
-                result = MagicMock()
-                result.exit_code = 0
-                result.output = b"no"
-                return result
-            elif "base64 -d" in str(cmd):
-                result = MagicMock()
-                result.exit_code = 0
-                return result
-            elif "rm -rf" in str(cmd):
-                result = MagicMock()
-                result.exit_code = 0
-                return result
-            elif "mkdir" in str(cmd):
-                result = MagicMock()
-                result.exit_code = 0
-                return result
-            return MagicMock(exit_code=0)
+            shell = _shell_command(args)
+            if shell.startswith("stat "):
+                return _ok(b"14|644|1609459200")
+            elif shell.startswith("test -d"):
+                return _IS_NOT_DIR
+            return _OK
 
         mock_container.exec_run.side_effect = exec_side_effect
+        _cat(mock_docker_client, b"source content")
 
         # Execute batch
         operations = [
@@ -753,29 +728,12 @@ class TestBatchOperations:
         """Test batch fails fast on ETag conflict."""
         mock_docker_client.containers.get.return_value = mock_container
 
-        # Mock read to return existing file with different etag
+        # Mock md5sum to return existing file with different etag
         def exec_side_effect(*args, **kwargs):
-            cmd = args[0]
-            if "stat" in str(cmd):
-                result = MagicMock()
-                result.exit_code = 0
-                result.output = b"5|644|1609459200"
-                return result
-            elif "cat" in str(cmd):
-                result = MagicMock()
-                result.exit_code = 0
-                result.output = b"hello"
-                return result
-            elif "test -d" in str(cmd):
-                result = MagicMock()
-                result.exit_code = 0
-                result.output = b"no"
-                return result
-            elif "mkdir" in str(cmd):
-                result = MagicMock()
-                result.exit_code = 0
-                return result
-            return MagicMock(exit_code=0)
+            shell = _shell_command(args)
+            if shell.startswith("md5sum"):
+                return _ok(b"5d41402abc4b2a76b9719d911017c592  -\n")
+            return _OK
 
         mock_container.exec_run.side_effect = exec_side_effect
 
@@ -801,68 +759,89 @@ class TestBatchOperations:
         """Test batch rolls back on failure."""
         mock_docker_client.containers.get.return_value = mock_container
 
-        call_count = [0]
-        put_archive_count = [0]
-
         def exec_side_effect(*args, **kwargs):
-            cmd = args[0]
-            call_count[0] += 1
-
-            # First operation: write file1.txt
-            if "stat -c '%s|%a|%Y'" in str(cmd) and "file1.txt" in str(cmd):
-                # File doesn't exist yet
-                result = MagicMock()
-                result.exit_code = 1
-                return result
-            elif "stat -c '%Y'" in str(cmd) and call_count[0] <= 6:
-                result = MagicMock()
-                result.exit_code = 0
-                result.output = b"1609459200"
-                return result
-
-            # Second operation: write file2.txt (this will fail)
-            elif "stat -c '%s|%a|%Y'" in str(cmd) and "file2.txt" in str(cmd):
-                # File doesn't exist yet
-                result = MagicMock()
-                result.exit_code = 1
-                return result
-
-            elif "mkdir" in str(cmd):
-                result = MagicMock()
-                result.exit_code = 0
-                return result
-            elif "rm -rf" in str(cmd):
-                result = MagicMock()
-                result.exit_code = 0
-                return result
-            else:
-                result = MagicMock()
-                result.exit_code = 0
-                return result
+            shell = _shell_command(args)
+            if shell.startswith("stat -L -c '%s|%a|%Y'"):
+                # Neither file exists yet
+                return _FAIL
+            return _OK
 
         mock_container.exec_run.side_effect = exec_side_effect
 
-        # Mock put_archive to fail on second call
-        def put_archive_side_effect(*args, **kwargs):
-            put_archive_count[0] += 1
-            if put_archive_count[0] == 1:
-                return True  # First write succeeds
-            else:
-                return False  # Second write fails
+        # Both writes share a wave, so fail by file name rather than call order
+        def put_archive_side_effect(path, data):
+            with tarfile.open(fileobj=io.BytesIO(data)) as tar:
+                return tar.getnames() != ["file2.txt"]
 
         mock_container.put_archive = MagicMock(side_effect=put_archive_side_effect)
 
-        # Execute batch where second operation fails
         operations = [
             BatchOperation(op_type=OperationType.WRITE, path="file1.txt", content=b"content1"),
             BatchOperation(op_type=OperationType.WRITE, path="file2.txt", content=b"content2"),
         ]
         result = await filesystem_manager.batch("c_test123", operations)
 
-        # Verify rollback was performed
         assert result.success is False
         assert result.rollback_performed is True
-        assert len(result.results) == 2  # First succeeded, second failed
+        assert len(result.results) == 2
+        # file1.txt did not exist before the batch, so rollback deletes it
+        assert (
+            call(["sh", "-c", "rm -rf /workspace/file1.txt"], user="1000:1000")
+            in mock_container.exec_run.call_args_list
+        )
+
+    async def test_batch_wave_operations_run_concurrently(
+        self, filesystem_manager, mock_docker_client, mock_container
+    ):
+        """Test operations in the same wave overlap instead of running serially."""
+        mock_docker_client.containers.get.return_value = mock_container
+        mock_container.exec_run.return_value = _OK
+
+        both_started = asyncio.Event()
+        started = []
+
+        async def fake_read(container_id, path):
+            started.append(path)
+            if len(started) == 2:
+                both_started.set()
+            # Times out unless the other read starts while this one is pending
+            await asyncio.wait_for(both_started.wait(), timeout=1)
+            return b"", FileInfo(
+                path=path,
+                size=0,
+                is_dir=False,
+                permissions="644",
+                mtime=datetime.now(),
+                etag="",
+            )
+
+        operations = [
+            BatchOperation(op_type=OperationType.READ, path="a.txt"),
+            BatchOperation(op_type=OperationType.READ, path="b.txt"),
+        ]
+        with patch.object(filesystem_manager, "read", side_effect=fake_read):
+            result = await filesystem_manager.batch("c_test123", operations)
+
+        assert result.success is True
+        assert sorted(started) == ["a.txt", "b.txt"]
+
+    def test_batch_waves_group_independent_operations(self, filesystem_manager):
+        """Test independent operations share a wave and same-path ones are ordered."""
+        operations = [
+            BatchOperation(op_type=OperationType.WRITE, path="a.txt", content=b"1"),
+            BatchOperation(op_type=OperationType.WRITE, path="b.txt", content=b"2"),
+            BatchOperation(op_type=OperationType.READ, path="a.txt"),
+            BatchOperation(op_type=OperationType.COPY, path="c.txt", dest_path="dir/c.txt"),
+            BatchOperation(op_type=OperationType.DELETE, path="dir"),
+        ]
+
+        waves = filesystem_manager._plan_batch_waves(operations)
+
+        assert [[op.path for op in wave] for wave in waves] == [
+            ["a.txt", "b.txt"],
+            ["a.txt", "c.txt"],
+            ["dir"],
+        ]
 
     async def test_batch_with_invalid_path(
         self, filesystem_manager, mock_docker_client, mock_container
@@ -885,7 +864,6 @@ class TestBatchOperations:
         assert result.success is False
 
 
-@pytest.mark.asyncio
 class TestImportExportOperations:
     """Tests for import/export operations."""
 
@@ -896,8 +874,7 @@ class TestImportExportOperations:
         # Mock tar command output
         tar_data = b"fake tar data"
 
-        exec_result = MagicMock()
-        exec_result.output = iter([tar_data])
+        exec_result = _streamed(tar_data)
         mock_container.exec_run.return_value = exec_result
 
         # Execute export
@@ -917,8 +894,7 @@ class TestImportExportOperations:
 
         tar_data = b"compressed tar data"
 
-        exec_result = MagicMock()
-        exec_result.output = iter([tar_data])
+        exec_result = _streamed(tar_data)
         mock_container.exec_run.return_value = exec_result
 
         # Execute export with compression
@@ -929,8 +905,9 @@ class TestImportExportOperations:
         # Verify
         assert len(chunks) == 1
         # Verify compression flag was used in command
-        call_args = mock_container.exec_run.call_args
-        assert "-z" in str(call_args) or "czf" in str(call_args)
+        mock_container.exec_run.assert_called_once_with(
+            ["sh", "-c", "tar -czf - -C /workspace ."], user="1000:1000", stream=True, demux=False
+        )
 
     async def test_export_tar_streaming(
         self, filesystem_manager, mock_docker_client, mock_container
@@ -941,8 +918,7 @@ class TestImportExportOperations:
         # Multiple chunks
         chunks_data = [b"chunk1", b"chunk2", b"chunk3"]
 
-        exec_result = MagicMock()
-        exec_result.output = iter(chunks_data)
+        exec_result = _streamed(*chunks_data)
         mock_container.exec_run.return_value = exec_result
 
         # Execute export
@@ -959,9 +935,6 @@ class TestImportExportOperations:
         mock_docker_client.containers.get.return_value = mock_container
 
         # Create a simple tar in memory
-        import io
-        import tarfile
-
         tar_buffer = io.BytesIO()
         with tarfile.open(fileobj=tar_buffer, mode="w") as tar:
             # Add a simple file
@@ -974,12 +947,8 @@ class TestImportExportOperations:
 
         # Mock exec commands
         def exec_side_effect(*args, **kwargs):
-            result = MagicMock()
-            result.exit_code = 0
-            cmd = args[0] if args else ""
-            if "wc -l" in str(cmd):
-                result.output = b"1"  # 1 file created
-            return result
+            # 1 file created
+            return _ok(b"1") if "wc -l" in _shell_command(args) else _OK
 
         mock_container.exec_run.side_effect = exec_side_effect
 
@@ -998,9 +967,6 @@ class TestImportExportOperations:
         mock_docker_client.containers.get.return_value = mock_container
 
         # Create tar data
-        import io
-        import tarfile
-
         tar_buffer = io.BytesIO()
         with tarfile.open(fileobj=tar_buffer, mode="w") as tar:
             file_data = b"streamed content"
@@ -1019,12 +985,7 @@ class TestImportExportOperations:
 
         # Mock exec commands
         def exec_side_effect(*args, **kwargs):
-            result = MagicMock()
-            result.exit_code = 0
-            cmd = args[0] if args else ""
-            if "wc -l" in str(cmd):
-                result.output = b"1"
-            return result
+            return _ok(b"1") if "wc -l" in _shell_command(args) else _OK
 
         mock_container.exec_run.side_effect = exec_side_effect
 
@@ -1057,9 +1018,6 @@ class TestImportExportOperations:
 
     async def test_validate_tar_rejects_absolute_paths(self, filesystem_manager):
         """Test tar validation rejects absolute paths."""
-        import io
-        import tarfile
-
         tar_buffer = io.BytesIO()
         with tarfile.open(fileobj=tar_buffer, mode="w") as tar:
             file_info = tarfile.TarInfo(name="/etc/passwd")
@@ -1076,9 +1034,6 @@ class TestImportExportOperations:
 
     async def test_validate_tar_rejects_parent_refs(self, filesystem_manager):
         """Test tar validation rejects parent directory references."""
-        import io
-        import tarfile
-
         tar_buffer = io.BytesIO()
         with tarfile.open(fileobj=tar_buffer, mode="w") as tar:
             file_info = tarfile.TarInfo(name="../etc/passwd")
@@ -1095,9 +1050,6 @@ class TestImportExportOperations:
 
     async def test_validate_tar_rejects_escape_attempts(self, filesystem_manager):
         """Test tar validation prevents workspace escape."""
-        import io
-        import tarfile
-
         tar_buffer = io.BytesIO()
         with tarfile.open(fileobj=tar_buffer, mode="w") as tar:
             # Try to escape by using many parent refs
@@ -1113,9 +1065,6 @@ class TestImportExportOperations:
 
     async def test_validate_tar_accepts_valid_paths(self, filesystem_manager):
         """Test tar validation accepts valid paths."""
-        import io
-        import tarfile
-
         tar_buffer = io.BytesIO()
         with tarfile.open(fileobj=tar_buffer, mode="w") as tar:
             # Valid paths
@@ -1133,24 +1082,13 @@ class TestImportExportOperations:
         """Test single file download."""
         mock_docker_client.containers.get.return_value = mock_container
 
-        # Mock file read
-        stat_output = MagicMock()
-        stat_output.exit_code = 0
-        stat_output.output = b"13|644|1609459200"
-
-        read_output = MagicMock()
-        read_output.exit_code = 0
-        read_output.output = b"downloaded file"
-
-        is_dir_output = MagicMock()
-        is_dir_output.exit_code = 0
-        is_dir_output.output = b"no"
-
-        mock_container.exec_run.side_effect = [
-            stat_output,
-            read_output,
-            is_dir_output,
-        ]
+        mock_container.exec_run.side_effect = _cmd_dispatcher(
+            {
+                "stat ": _ok(b"15|644|1609459200"),
+                "test -d": _IS_NOT_DIR,
+            }
+        )
+        _cat(mock_docker_client, b"downloaded file")
 
         # Execute download
         content, file_info = await filesystem_manager.download_file("c_test123", "file.txt")
@@ -1158,4 +1096,4 @@ class TestImportExportOperations:
         # Verify
         assert content == b"downloaded file"
         assert file_info.path == "/workspace/file.txt"
-        assert file_info.size == 13
+        assert file_info.size == 15
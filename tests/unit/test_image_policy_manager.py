@@ -1,7 +1,7 @@
 """Unit tests for ImagePolicyManager."""
 
 import json
-import os
+from types import SimpleNamespace
 from unittest.mock import MagicMock, Mock, patch
 
 import pytest
@@ -10,17 +10,25 @@ from docker.errors import APIError, ImageNotFound
 from mcp_devbench.managers.image_policy_manager import ImagePolicyManager, ResolvedImage
 from mcp_devbench.utils.exceptions import ImagePolicyError
 
+_AUTH_CONFIG_JSON = json.dumps({"auths": {"docker.io": {"auth": "dXNlcjpwYXNz"}}})
 
-@pytest.fixture
+
+def _img(digest="sha256:abcd1234"):
+    """Build a stand-in local image; the manager only reads its ``attrs``."""
+    repo_digests = [f"docker.io/library/python@{digest}"] if digest else []
+    return SimpleNamespace(attrs={"RepoDigests": repo_digests})
+
+
+@pytest.fixture(scope="session")
 def mock_docker_client():
-    """Create a mock Docker client."""
+    """Create a mock Docker client shared across tests."""
     client = MagicMock()
     return client
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def image_policy_manager(mock_docker_client):
-    """Create an ImagePolicyManager with mocked Docker client."""
+    """Create an ImagePolicyManager with mocked Docker client, once per session."""
     with patch("mcp_devbench.managers.image_policy_manager.get_docker_client") as mock_get_client:
         mock_get_client.return_value = mock_docker_client
         with patch("mcp_devbench.managers.image_policy_manager.get_settings") as mock_settings:
@@ -28,30 +36,33 @@ def image_policy_manager(mock_docker_client):
             settings.allowed_registries_list = ["docker.io", "ghcr.io"]
             mock_settings.return_value = settings
             manager = ImagePolicyManager()
-            yield manager
+    return manager
 
 
-def test_extract_registry_default(image_policy_manager):
-    """Test extracting registry from simple image reference."""
-    assert image_policy_manager._extract_registry("python:3.11") == "docker.io"
-    assert image_policy_manager._extract_registry("ubuntu") == "docker.io"
-
-
-def test_extract_registry_explicit(image_policy_manager):
-    """Test extracting registry from explicit registry reference."""
-    assert image_policy_manager._extract_registry("docker.io/python:3.11") == "docker.io"
-    assert image_policy_manager._extract_registry("ghcr.io/owner/repo:tag") == "ghcr.io"
-    assert (
-        image_policy_manager._extract_registry("registry.example.com/image:tag")
-        == "registry.example.com"
-    )
-    assert image_policy_manager._extract_registry("localhost:5000/image:tag") == "localhost:5000"
+@pytest.fixture(autouse=True)
+def reset_shared_state(image_policy_manager, mock_docker_client):
+    """Reset the shared mock and digest cache between tests."""
+    yield
+    mock_docker_client.reset_mock(return_value=True, side_effect=True)
+    image_policy_manager.clear_digest_cache()
 
 
-def test_extract_registry_with_namespace(image_policy_manager):
-    """Test extracting registry from image with namespace."""
-    assert image_policy_manager._extract_registry("library/python:3.11") == "docker.io"
-    assert image_policy_manager._extract_registry("myuser/myimage:latest") == "docker.io"
+@pytest.mark.parametrize(
+    ("ref", "expected"),
+    [
+        ("python:3.11", "docker.io"),
+        ("ubuntu", "docker.io"),
+        ("docker.io/python:3.11", "docker.io"),
+        ("ghcr.io/owner/repo:tag", "ghcr.io"),
+        ("registry.example.com/image:tag", "registry.example.com"),
+        ("localhost:5000/image:tag", "localhost:5000"),
+        ("library/python:3.11", "docker.io"),
+        ("myuser/myimage:latest", "docker.io"),
+    ],
+)
+def test_extract_registry(image_policy_manager, ref, expected):
+    """Test extracting the registry from image references."""
+    assert image_policy_manager._extract_registry(ref) == expected
 
 
 def test_validate_registry_allowed(image_policy_manager):
@@ -70,32 +81,19 @@ def test_validate_registry_denied(image_policy_manager):
     assert "evil.registry.com" in str(exc_info.value)
 
 
-def test_normalize_image_ref_simple(image_policy_manager):
-    """Test normalizing simple image references."""
-    assert (
-        image_policy_manager._normalize_image_ref("python:3.11") == "docker.io/library/python:3.11"
-    )
-    assert image_policy_manager._normalize_image_ref("ubuntu") == "docker.io/library/ubuntu"
-
-
-def test_normalize_image_ref_with_namespace(image_policy_manager):
-    """Test normalizing image references with namespace."""
-    assert (
-        image_policy_manager._normalize_image_ref("myuser/myimage:tag")
-        == "docker.io/myuser/myimage:tag"
-    )
-
-
-def test_normalize_image_ref_explicit_registry(image_policy_manager):
-    """Test normalizing image references with explicit registry."""
-    assert (
-        image_policy_manager._normalize_image_ref("ghcr.io/owner/repo:tag")
-        == "ghcr.io/owner/repo:tag"
-    )
-    assert (
-        image_policy_manager._normalize_image_ref("registry.example.com/image:tag")
-        == "registry.example.com/image:tag"
-    )
+@pytest.mark.parametrize(
+    ("ref", "expected"),
+    [
+        ("python:3.11", "docker.io/library/python:3.11"),
+        ("ubuntu", "docker.io/library/ubuntu"),
+        ("myuser/myimage:tag", "docker.io/myuser/myimage:tag"),
+        ("ghcr.io/owner/repo:tag", "ghcr.io/owner/repo:tag"),
+        ("registry.example.com/image:tag", "registry.example.com/image:tag"),
+    ],
+)
+def test_normalize_image_ref(image_policy_manager, ref, expected):
+    """Test normalizing image references to fully qualified form."""
+    assert image_policy_manager._normalize_image_ref(ref) == expected
 
 
 def test_validate_image_ref_valid(image_policy_manager):
@@ -109,12 +107,10 @@ def test_validate_image_ref_invalid(image_policy_manager):
     assert image_policy_manager.validate_image_ref("evil.registry.com/image:tag") is False
 
 
-@pytest.mark.asyncio
 async def test_resolve_image_already_present(image_policy_manager, mock_docker_client):
     """Test resolving an image that's already present locally."""
     # Mock image already present
-    mock_image = MagicMock()
-    mock_docker_client.images.get.return_value = mock_image
+    mock_docker_client.images.get.return_value = _img()
 
     result = await image_policy_manager.resolve_image("python:3.11")
 
@@ -128,7 +124,6 @@ async def test_resolve_image_already_present(image_policy_manager, mock_docker_c
     mock_docker_client.images.pull.assert_not_called()
 
 
-@pytest.mark.asyncio
 async def test_resolve_image_needs_pull(image_policy_manager, mock_docker_client):
     """Test resolving an image that needs to be pulled."""
     # Mock image not present, needs pull
@@ -145,7 +140,6 @@ async def test_resolve_image_needs_pull(image_policy_manager, mock_docker_client
     mock_docker_client.images.pull.assert_called_once()
 
 
-@pytest.mark.asyncio
 async def test_resolve_image_pull_failure(image_policy_manager, mock_docker_client):
     """Test resolving an image when pull fails."""
     # Mock image not present and pull fails
@@ -158,7 +152,6 @@ async def test_resolve_image_pull_failure(image_policy_manager, mock_docker_clie
     assert "Failed to pull image" in str(exc_info.value)
 
 
-@pytest.mark.asyncio
 async def test_resolve_image_disallowed_registry(image_policy_manager, mock_docker_client):
     """Test resolving an image from disallowed registry."""
     with pytest.raises(ImagePolicyError) as exc_info:
@@ -167,13 +160,10 @@ async def test_resolve_image_disallowed_registry(image_policy_manager, mock_dock
     assert "not in allow-list" in str(exc_info.value)
 
 
-@pytest.mark.asyncio
 async def test_resolve_image_with_digest(image_policy_manager, mock_docker_client):
     """Test resolving an image with digest pinning."""
     # Mock image present with digest
-    mock_image = MagicMock()
-    mock_image.attrs = {"RepoDigests": ["docker.io/library/python@sha256:abcd1234"]}
-    mock_docker_client.images.get.return_value = mock_image
+    mock_docker_client.images.get.return_value = _img()
 
     result = await image_policy_manager.resolve_image("python:3.11", pin_digest=True)
 
@@ -181,26 +171,20 @@ async def test_resolve_image_with_digest(image_policy_manager, mock_docker_clien
     assert "@sha256:abcd1234" in result.resolved_ref
 
 
-@pytest.mark.asyncio
 async def test_get_image_digest(image_policy_manager, mock_docker_client):
     """Test getting image digest."""
     # Mock image with digest
-    mock_image = MagicMock()
-    mock_image.attrs = {"RepoDigests": ["docker.io/library/python@sha256:abcd1234"]}
-    mock_docker_client.images.get.return_value = mock_image
+    mock_docker_client.images.get.return_value = _img()
 
     digest = await image_policy_manager._get_image_digest("python:3.11")
 
     assert digest == "sha256:abcd1234"
 
 
-@pytest.mark.asyncio
 async def test_get_image_digest_cache(image_policy_manager, mock_docker_client):
     """Test digest caching."""
     # Mock image with digest
-    mock_image = MagicMock()
-    mock_image.attrs = {"RepoDigests": ["docker.io/library/python@sha256:abcd1234"]}
-    mock_docker_client.images.get.return_value = mock_image
+    mock_docker_client.images.get.return_value = _img()
 
     # First call
     digest1 = await image_policy_manager._get_image_digest("python:3.11")
@@ -213,13 +197,10 @@ async def test_get_image_digest_cache(image_policy_manager, mock_docker_client):
     assert mock_docker_client.images.get.call_count == 1
 
 
-@pytest.mark.asyncio
 async def test_get_image_digest_no_digest(image_policy_manager, mock_docker_client):
     """Test getting digest when image has no digest."""
     # Mock image without digest
-    mock_image = MagicMock()
-    mock_image.attrs = {"RepoDigests": []}
-    mock_docker_client.images.get.return_value = mock_image
+    mock_docker_client.images.get.return_value = _img(digest=None)
 
     digest = await image_policy_manager._get_image_digest("python:3.11")
 
@@ -237,29 +218,27 @@ def test_clear_digest_cache(image_policy_manager):
     assert len(image_policy_manager._digest_cache) == 0
 
 
-def test_load_docker_auth_with_config(image_policy_manager):
+def test_load_docker_auth_with_config(image_policy_manager, monkeypatch):
     """Test loading Docker authentication from environment."""
-    auth_config = {"auths": {"docker.io": {"auth": "dXNlcjpwYXNz"}}}
-
-    with patch.dict(os.environ, {"MCP_DOCKER_CONFIG_JSON": json.dumps(auth_config)}):
-        result = image_policy_manager._load_docker_auth()
+    monkeypatch.setenv("MCP_DOCKER_CONFIG_JSON", _AUTH_CONFIG_JSON)
+    result = image_policy_manager._load_docker_auth()
 
     assert result is not None
     assert "docker.io" in result
 
 
-def test_load_docker_auth_invalid_json(image_policy_manager):
+def test_load_docker_auth_invalid_json(image_policy_manager, monkeypatch):
     """Test loading Docker authentication with invalid JSON."""
-    with patch.dict(os.environ, {"MCP_DOCKER_CONFIG_JSON": "invalid json"}):
-        result = image_policy_manager._load_docker_auth()
+    monkeypatch.setenv("MCP_DOCKER_CONFIG_JSON", "invalid json")
+    result = image_policy_manager._load_docker_auth()
 
     # Should return None on parse error
     assert result is None
 
 
-def test_load_docker_auth_no_env(image_policy_manager):
+def test_load_docker_auth_no_env(image_policy_manager, monkeypatch):
     """Test loading Docker authentication when no env var set."""
-    with patch.dict(os.environ, {}, clear=True):
-        result = image_policy_manager._load_docker_auth()
+    monkeypatch.delenv("MCP_DOCKER_CONFIG_JSON", raising=False)
+    result = image_policy_manager._load_docker_auth()
 
     assert result is None
@@ -5,11 +5,14 @@ import pytest
 from mcp_devbench.managers.output_streamer import OutputStreamer
 
 
-@pytest.mark.asyncio
-async def test_init_exec():
-    """Test initializing streaming for a new exec."""
-    streamer = OutputStreamer()
+@pytest.fixture
+def streamer():
+    """Create an output streamer with default limits."""
+    return OutputStreamer()
+
 
+async def test_init_exec(streamer):
+    """Test initializing streaming for a new exec."""
     await streamer.init_exec("e_test123")
 
     stats = await streamer.get_stats("e_test123")
@@ -20,11 +23,8 @@ async def test_init_exec():
     assert stats["is_complete"] is False
 
 
-@pytest.mark.asyncio
-async def test_add_output():
+async def test_add_output(streamer):
     """Test adding output chunks."""
-    streamer = OutputStreamer()
-
     await streamer.init_exec("e_test123")
 
     # Add stdout
@@ -41,14 +41,11 @@ async def test_add_output():
     assert stats["buffered_bytes"] == 12  # 6 + 6
 
 
-@pytest.mark.asyncio
-async def test_poll_output():
+async def test_poll_output(streamer):
     """Test polling for output chunks."""
-    streamer = OutputStreamer()
-
     await streamer.init_exec("e_test123")
-    await streamer.add_output("e_test123", "stdout", b"Line 1\n")
-    await streamer.add_output("e_test123", "stdout", b"Line 2\n")
+    await streamer.add_output("e_test123", "stdout", b"Line 1\n", coalesce=False)
+    await streamer.add_output("e_test123", "stdout", b"Line 2\n", coalesce=False)
     await streamer.add_output("e_test123", "stderr", b"Error\n")
 
     # Poll all chunks
@@ -66,11 +63,32 @@ async def test_poll_output():
     assert chunks[1]["seq"] == 2
 
 
-@pytest.mark.asyncio
-async def test_complete():
-    """Test marking execution as complete."""
-    streamer = OutputStreamer()
+async def test_add_output_coalesces_small_writes(streamer):
+    """Test consecutive small writes to one stream share a chunk until polled."""
+    await streamer.init_exec("e_test123")
+
+    assert await streamer.add_output("e_test123", "stdout", b"Line 1\n") == 0
+    assert await streamer.add_output("e_test123", "stdout", b"Line 2\n") == 0
+    # A different stream starts a new chunk
+    assert await streamer.add_output("e_test123", "stderr", b"Error\n") == 1
+
+    chunks, _ = await streamer.poll("e_test123")
+    assert [c["data"] for c in chunks] == ["Line 1\nLine 2\n", "Error\n"]
+
+    # Polled chunks are sealed so a cursor never misses appended data
+    assert await streamer.add_output("e_test123", "stderr", b"More\n") == 2
+
+    # Writes that would exceed the coalescing limit start a new chunk
+    big = b"x" * OutputStreamer.COALESCE_MAX_BYTES
+    assert await streamer.add_output("e_test123", "stderr", big) == 3
+
+    stats = await streamer.get_stats("e_test123")
+    assert stats["chunk_count"] == 4
+    assert stats["buffered_bytes"] == 14 + 6 + 5 + len(big)
+
 
+async def test_complete(streamer):
+    """Test marking execution as complete."""
     await streamer.init_exec("e_test123")
     await streamer.add_output("e_test123", "stdout", b"Output\n")
 
@@ -91,7 +109,6 @@ async def test_complete():
     assert completion["complete"] is True
 
 
-@pytest.mark.asyncio
 async def test_buffer_size_limit():
     """Test that buffer size is limited."""
     # Small buffer size for testing
@@ -100,22 +117,21 @@ async def test_buffer_size_limit():
     await streamer.init_exec("e_test123")
 
     # Add data within limit
-    seq1 = await streamer.add_output("e_test123", "stdout", b"x" * 50)
+    seq1 = await streamer.add_output("e_test123", "stdout", b"x" * 50, coalesce=False)
     assert seq1 == 0
 
     # Add more data within limit
-    seq2 = await streamer.add_output("e_test123", "stdout", b"y" * 49)
+    seq2 = await streamer.add_output("e_test123", "stdout", b"y" * 49, coalesce=False)
     assert seq2 == 1
 
     # Try to add data that exceeds limit
-    seq3 = await streamer.add_output("e_test123", "stdout", b"z" * 10)
+    seq3 = await streamer.add_output("e_test123", "stdout", b"z" * 10, coalesce=False)
     assert seq3 is None  # Should be dropped
 
     stats = await streamer.get_stats("e_test123")
     assert stats["buffered_bytes"] == 99  # Only first two chunks
 
 
-@pytest.mark.asyncio
 async def test_chunk_limit():
     """Test that chunk count is limited."""
     # Small chunk limit for testing
@@ -124,15 +140,15 @@ async def test_chunk_limit():
     await streamer.init_exec("e_test123")
 
     # Add chunks up to limit
-    await streamer.add_output("e_test123", "stdout", b"1")
-    await streamer.add_output("e_test123", "stdout", b"2")
-    await streamer.add_output("e_test123", "stdout", b"3")
+    await streamer.add_output("e_test123", "stdout", b"1", coalesce=False)
+    await streamer.add_output("e_test123", "stdout", b"2", coalesce=False)
+    await streamer.add_output("e_test123", "stdout", b"3", coalesce=False)
 
     stats = await streamer.get_stats("e_test123")
     assert stats["chunk_count"] == 3
 
     # Add another chunk (should evict oldest)
-    await streamer.add_output("e_test123", "stdout", b"4")
+    await streamer.add_output("e_test123", "stdout", b"4", coalesce=False)
 
     stats = await streamer.get_stats("e_test123")
     assert stats["chunk_count"] == 3  # Still 3
@@ -143,11 +159,30 @@ async def test_chunk_limit():
     assert chunks[0]["seq"] == 1  # Starts at seq 1 (0 was evicted)
 
 
-@pytest.mark.asyncio
-async def test_cleanup():
-    """Test cleaning up buffers for an exec."""
-    streamer = OutputStreamer()
+async def test_poll_after_eviction():
+    """Test polling from a cursor inside, before and past the buffered window."""
+    streamer = OutputStreamer(max_chunks=3)
+
+    await streamer.init_exec("e_test123")
+    for i in range(5):
+        await streamer.add_output("e_test123", "stdout", str(i).encode(), coalesce=False)
+    await streamer.complete("e_test123", 0, {"wall_ms": 1})
+
+    # Buffer now holds seqs 2, 3, 4 and the completion at 5
+    chunks, _ = await streamer.poll("e_test123", after_seq=3)
+    assert [c["seq"] for c in chunks] == [4, 5]
+
+    # A cursor older than the window returns everything still buffered
+    chunks, _ = await streamer.poll("e_test123", after_seq=0)
+    assert [c["seq"] for c in chunks] == [2, 3, 4, 5]
 
+    chunks, is_complete = await streamer.poll("e_test123", after_seq=5)
+    assert chunks == []
+    assert is_complete is True
+
+
+async def test_cleanup(streamer):
+    """Test cleaning up buffers for an exec."""
     await streamer.init_exec("e_test123")
     await streamer.add_output("e_test123", "stdout", b"Output\n")
     await streamer.complete("e_test123", 0, {"wall_ms": 100})
@@ -165,11 +200,8 @@ async def test_cleanup():
     assert is_complete is False
 
 
-@pytest.mark.asyncio
-async def test_cleanup_old():
+async def test_cleanup_old(streamer):
     """Test cleaning up old completed execs."""
-    streamer = OutputStreamer()
-
     # Create exec that will be old
     await streamer.init_exec("e_old")
     await streamer.add_output("e_old", "stdout", b"Old\n")
@@ -191,11 +223,8 @@ async def test_cleanup_old():
     assert len(chunks2) > 0
 
 
-@pytest.mark.asyncio
-async def test_multiple_execs():
+async def test_multiple_execs(streamer):
     """Test handling multiple execs simultaneously."""
-    streamer = OutputStreamer()
-
     # Init multiple execs
     await streamer.init_exec("e_1")
     await streamer.init_exec("e_2")
@@ -220,11 +249,8 @@ async def test_multiple_execs():
     assert chunks3[0]["data"] == "Output 3\n"
 
 
-@pytest.mark.asyncio
-async def test_poll_nonexistent_exec():
+async def test_poll_nonexistent_exec(streamer):
     """Test polling for a nonexistent exec."""
-    streamer = OutputStreamer()
-
     chunks, is_complete = await streamer.poll("e_nonexistent")
     assert len(chunks) == 0
     assert is_complete is False
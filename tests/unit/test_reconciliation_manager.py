@@ -1,6 +1,7 @@
 """Tests for ReconciliationManager."""
 
 from datetime import datetime, timedelta, timezone
+from types import SimpleNamespace
 from unittest.mock import AsyncMock, MagicMock, patch
 
 import pytest
@@ -35,21 +36,21 @@ def reconciliation_manager(mock_docker_client, mock_db_manager):
     return manager, mock_docker_client, session
 
 
-@pytest.mark.asyncio
 async def test_reconcile_discovers_containers(reconciliation_manager):
     """Test that reconcile discovers containers with MCP label."""
     manager, docker_client, session = reconciliation_manager
 
     # Mock Docker containers
-    mock_container = MagicMock()
-    mock_container.id = "docker123"
-    mock_container.labels = {
-        "com.mcp.devbench": "true",
-        "com.mcp.container_id": "c_test123",
-    }
-    mock_container.status = "running"
-    mock_container.attrs = {"Mounts": []}
-    mock_container.image.tags = ["python:3.11-slim"]
+    mock_container = SimpleNamespace(
+        id="docker123",
+        labels={
+            "com.mcp.devbench": "true",
+            "com.mcp.container_id": "c_test123",
+        },
+        status="running",
+        attrs={"Mounts": []},
+        image=SimpleNamespace(tags=["python:3.11-slim"]),
+    )
 
     docker_client.containers.list.return_value = [mock_container]
 
@@ -66,7 +67,6 @@ async def test_reconcile_discovers_containers(reconciliation_manager):
             assert stats["adopted"] == 1
 
 
-@pytest.mark.asyncio
 async def test_reconcile_cleans_up_missing_containers(reconciliation_manager):
     """Test that reconcile cleans up containers missing from Docker."""
     manager, docker_client, session = reconciliation_manager
@@ -93,17 +93,17 @@ async def test_reconcile_cleans_up_missing_containers(reconciliation_manager):
 
     with patch.object(ContainerRepository, "list_all", new_callable=AsyncMock) as mock_list:
         with patch.object(
-            ContainerRepository, "update_status", new_callable=AsyncMock
+            ContainerRepository, "update_status_bulk", new_callable=AsyncMock
         ) as mock_update:
             mock_list.return_value = [db_container]
+            mock_update.return_value = 1
 
             stats = await manager.reconcile()
 
             assert stats["cleaned_up"] == 1
-            mock_update.assert_called_once()
+            mock_update.assert_called_once_with(["c_test123"], "stopped")
 
 
-@pytest.mark.asyncio
 async def test_reconcile_handles_orphaned_transients(reconciliation_manager):
     """Test that reconcile removes old transient containers."""
     manager, docker_client, session = reconciliation_manager
@@ -149,46 +149,44 @@ async def test_reconcile_handles_orphaned_transients(reconciliation_manager):
                 mock_delete.assert_called_once_with("c_old123")
 
 
-@pytest.mark.asyncio
 async def test_adopt_container_with_alias(reconciliation_manager):
     """Test adopting a container with an alias."""
     manager, docker_client, session = reconciliation_manager
 
     # Mock Docker container with alias
-    mock_container = MagicMock()
-    mock_container.id = "docker123"
-    mock_container.labels = {
-        "com.mcp.devbench": "true",
-        "com.mcp.container_id": "c_test123",
-        "com.mcp.alias": "my-container",
-    }
-    mock_container.status = "running"
-    mock_container.attrs = {
-        "Mounts": [{"Destination": "/workspace", "Name": "mcpdevbench_persist_c_test123"}]
-    }
-    mock_container.image.tags = ["python:3.11-slim"]
+    mock_container = SimpleNamespace(
+        id="docker123",
+        labels={
+            "com.mcp.devbench": "true",
+            "com.mcp.container_id": "c_test123",
+            "com.mcp.alias": "my-container",
+        },
+        status="running",
+        attrs={"Mounts": [{"Destination": "/workspace", "Name": "mcpdevbench_persist_c_test123"}]},
+        image=SimpleNamespace(tags=["python:3.11-slim"]),
+    )
 
     from mcp_devbench.repositories.containers import ContainerRepository
 
+    now = datetime(2025, 1, 1, tzinfo=timezone.utc)
+
     with patch.object(ContainerRepository, "create", new_callable=AsyncMock) as mock_create:
-        await manager._adopt_container(mock_container, session)
+        await manager._adopt_container(mock_container, session, now)
 
         mock_create.assert_called_once()
         call_args = mock_create.call_args[0][0]
         assert call_args.id == "c_test123"
         assert call_args.alias == "my-container"
         assert call_args.persistent is True
+        assert call_args.created_at == call_args.last_seen == now
 
 
-@pytest.mark.asyncio
 async def test_adopt_container_without_id_skips(reconciliation_manager):
     """Test that adopting a container without ID is skipped."""
     manager, docker_client, session = reconciliation_manager
 
     # Mock Docker container without container_id label
-    mock_container = MagicMock()
-    mock_container.id = "docker123"
-    mock_container.labels = {"com.mcp.devbench": "true"}
+    mock_container = SimpleNamespace(id="docker123", labels={"com.mcp.devbench": "true"})
 
     from mcp_devbench.repositories.containers import ContainerRepository
 
@@ -199,8 +197,7 @@ async def test_adopt_container_without_id_skips(reconciliation_manager):
         mock_create.assert_not_called()
 
 
-@pytest.mark.asyncio
-async def test_discover_containers_returns_empty_on_error(reconciliation_manager):
+def test_discover_containers_returns_empty_on_error(reconciliation_manager):
     """Test that discovery returns empty list on error."""
     manager, docker_client, session = reconciliation_manager
 
@@ -212,3 +209,15 @@ async def test_discover_containers_returns_empty_on_error(reconciliation_manager
     containers = manager._discover_containers()
 
     assert containers == []
+
+
+def test_discover_containers_filters_by_label(reconciliation_manager):
+    """Test that discovery lets the Docker daemon filter by the MCP label."""
+    manager, docker_client, session = reconciliation_manager
+    docker_client.containers.list.return_value = []
+
+    manager._discover_containers()
+
+    docker_client.containers.list.assert_called_once_with(
+        all=True, filters={"label": "com.mcp.devbench=true"}
+    )
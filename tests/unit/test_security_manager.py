@@ -89,6 +89,18 @@ def test_get_container_security_config_as_root(security_manager):
     assert config["privileged"] is False
 
 
+def test_get_container_security_config_default_is_fresh_per_call(security_manager):
+    """Test cached default config is copied so callers cannot change later results."""
+    root_config = security_manager.get_container_security_config(as_root=True)
+    root_config["privileged"] = True
+
+    config = security_manager.get_container_security_config()
+
+    assert config is not root_config
+    assert config["user"] == "1000:1000"
+    assert config["privileged"] is False
+
+
 def test_get_container_security_config_custom_policy(security_manager):
     """Test getting container security config with custom policy."""
     limits = ResourceLimits(memory_mb=1024, cpu_quota=50000, pids_limit=128)
@@ -1,11 +1,30 @@
 """Tests for ShutdownCoordinator."""
 
+import asyncio
+from datetime import datetime, timezone
 from unittest.mock import AsyncMock, MagicMock, patch
 
 import pytest
 
+from mcp_devbench.managers.container_manager import ContainerManager
 from mcp_devbench.managers.shutdown_coordinator import ShutdownCoordinator
 from mcp_devbench.models.containers import Container
+from mcp_devbench.repositories.containers import ContainerRepository
+
+_NOW = datetime.now(timezone.utc)
+
+
+def _transient(container_id: str, docker_id: str = "docker123") -> Container:
+    """Build a running transient container record."""
+    return Container(
+        id=container_id,
+        docker_id=docker_id,
+        image="python:3.11-slim",
+        persistent=False,
+        created_at=_NOW,
+        last_seen=_NOW,
+        status="running",
+    )
 
 
 @pytest.fixture
@@ -26,16 +45,12 @@ def shutdown_coordinator(mock_db_manager):
     return coordinator, session
 
 
-@pytest.mark.asyncio
 async def test_shutdown_sets_flag(shutdown_coordinator):
     """Test that shutdown sets the shutdown flag."""
     coordinator, session = shutdown_coordinator
 
     assert not coordinator.is_shutting_down()
 
-    # Mock container manager
-    from mcp_devbench.repositories.containers import ContainerRepository
-
     with patch.object(ContainerRepository, "list_by_status", new_callable=AsyncMock) as mock_list:
         mock_list.return_value = []
 
@@ -44,66 +59,44 @@ async def test_shutdown_sets_flag(shutdown_coordinator):
         assert coordinator.is_shutting_down()
 
 
-@pytest.mark.asyncio
 async def test_shutdown_stops_transient_containers(shutdown_coordinator):
     """Test that shutdown stops transient containers."""
     coordinator, session = shutdown_coordinator
 
-    # Create mock transient container
-    from datetime import datetime, timezone
-
-    transient = Container(
-        id="c_transient",
-        docker_id="docker123",
-        alias=None,
-        image="python:3.11-slim",
-        digest=None,
-        persistent=False,
-        created_at=datetime.now(timezone.utc),
-        last_seen=datetime.now(timezone.utc),
-        ttl_s=None,
-        volume_name=None,
-        status="running",
-    )
-
-    from mcp_devbench.managers.container_manager import ContainerManager
-    from mcp_devbench.repositories.containers import ContainerRepository
+    transient = _transient("c_transient")
 
-    with patch.object(ContainerRepository, "list_by_status", new_callable=AsyncMock) as mock_list:
-        with patch.object(ContainerManager, "stop_container", new_callable=AsyncMock) as mock_stop:
-            mock_list.return_value = [transient]
+    with (
+        patch.object(ContainerRepository, "list_by_status", new_callable=AsyncMock) as mock_list,
+        patch.object(ContainerManager, "stop_container", new_callable=AsyncMock) as mock_stop,
+    ):
+        mock_list.return_value = [transient]
 
-            await coordinator.initiate_shutdown()
+        await coordinator.initiate_shutdown()
 
-            mock_stop.assert_called_once_with("c_transient", timeout=10)
+        mock_stop.assert_called_once_with("c_transient", timeout=10)
 
 
-@pytest.mark.asyncio
 async def test_shutdown_preserves_persistent_containers(shutdown_coordinator):
     """Test that shutdown does not stop persistent containers."""
     coordinator, session = shutdown_coordinator
 
-    from mcp_devbench.managers.container_manager import ContainerManager
-    from mcp_devbench.repositories.containers import ContainerRepository
-
-    with patch.object(ContainerRepository, "list_by_status", new_callable=AsyncMock) as mock_list:
-        with patch.object(ContainerManager, "stop_container", new_callable=AsyncMock) as mock_stop:
-            # Only return transient containers (not persistent)
-            mock_list.return_value = []
+    with (
+        patch.object(ContainerRepository, "list_by_status", new_callable=AsyncMock) as mock_list,
+        patch.object(ContainerManager, "stop_container", new_callable=AsyncMock) as mock_stop,
+    ):
+        # Only return transient containers (not persistent)
+        mock_list.return_value = []
 
-            await coordinator.initiate_shutdown()
+        await coordinator.initiate_shutdown()
 
-            # Should not stop any containers
-            mock_stop.assert_not_called()
+        # Should not stop any containers
+        mock_stop.assert_not_called()
 
 
-@pytest.mark.asyncio
 async def test_shutdown_idempotent(shutdown_coordinator):
     """Test that shutdown can be called multiple times safely."""
     coordinator, session = shutdown_coordinator
 
-    from mcp_devbench.repositories.containers import ContainerRepository
-
     with patch.object(ContainerRepository, "list_by_status", new_callable=AsyncMock) as mock_list:
         mock_list.return_value = []
 
@@ -114,67 +107,62 @@ async def test_shutdown_idempotent(shutdown_coordinator):
         assert mock_list.call_count == 1
 
 
-@pytest.mark.asyncio
 async def test_shutdown_continues_on_error(shutdown_coordinator):
     """Test that shutdown continues even if stopping a container fails."""
     coordinator, session = shutdown_coordinator
 
-    # Create mock transient containers
-    from datetime import datetime, timezone
+    transient1 = _transient("c_transient1", "docker123")
+    transient2 = _transient("c_transient2", "docker456")
 
-    transient1 = Container(
-        id="c_transient1",
-        docker_id="docker123",
-        alias=None,
-        image="python:3.11-slim",
-        digest=None,
-        persistent=False,
-        created_at=datetime.now(timezone.utc),
-        last_seen=datetime.now(timezone.utc),
-        ttl_s=None,
-        volume_name=None,
-        status="running",
-    )
+    with (
+        patch.object(ContainerRepository, "list_by_status", new_callable=AsyncMock) as mock_list,
+        patch.object(ContainerManager, "stop_container", new_callable=AsyncMock) as mock_stop,
+    ):
+        mock_list.return_value = [transient1, transient2]
 
-    transient2 = Container(
-        id="c_transient2",
-        docker_id="docker456",
-        alias=None,
-        image="python:3.11-slim",
-        digest=None,
-        persistent=False,
-        created_at=datetime.now(timezone.utc),
-        last_seen=datetime.now(timezone.utc),
-        ttl_s=None,
-        volume_name=None,
-        status="running",
-    )
+        # First stop fails, second succeeds
+        mock_stop.side_effect = [Exception("Stop failed"), None]
+
+        await coordinator.initiate_shutdown()
 
-    from mcp_devbench.managers.container_manager import ContainerManager
-    from mcp_devbench.repositories.containers import ContainerRepository
+        # Should have tried to stop both containers
+        assert mock_stop.call_count == 2
 
-    with patch.object(ContainerRepository, "list_by_status", new_callable=AsyncMock) as mock_list:
-        with patch.object(ContainerManager, "stop_container", new_callable=AsyncMock) as mock_stop:
-            mock_list.return_value = [transient1, transient2]
 
-            # First stop fails, second succeeds
-            mock_stop.side_effect = [Exception("Stop failed"), None]
+async def test_shutdown_stops_transients_concurrently(shutdown_coordinator):
+    """Test that transient containers are stopped concurrently, not one after another."""
+    coordinator, session = shutdown_coordinator
+
+    transients = [_transient(f"c_transient{i}", f"docker{i}") for i in range(2)]
 
-            await coordinator.initiate_shutdown()
+    both_stopping = asyncio.Event()
+    stopping = []
+    stopped = []
 
-            # Should have tried to stop both containers
-            assert mock_stop.call_count == 2
+    async def slow_stop(container_id, timeout):
+        stopping.append(container_id)
+        if len(stopping) == len(transients):
+            both_stopping.set()
+        # Times out unless the other stop starts while this one is pending
+        await asyncio.wait_for(both_stopping.wait(), timeout=1)
+        stopped.append(container_id)
+
+    with (
+        patch.object(ContainerRepository, "list_by_status", new_callable=AsyncMock) as mock_list,
+        patch.object(ContainerManager, "stop_container", side_effect=slow_stop) as mock_stop,
+    ):
+        mock_list.return_value = transients
+
+        await coordinator.initiate_shutdown()
+
+        assert mock_stop.call_count == 2
+        assert sorted(stopped) == ["c_transient0", "c_transient1"]
 
 
-@pytest.mark.asyncio
 async def test_wait_for_shutdown(shutdown_coordinator):
     """Test waiting for shutdown to complete."""
     coordinator, session = shutdown_coordinator
 
-    import asyncio
-
-    from mcp_devbench.repositories.containers import ContainerRepository
-
     async def shutdown_later():
         await asyncio.sleep(0.1)
         with patch.object(
@@ -1,20 +1,32 @@
 """Unit tests for WarmPoolManager."""
 
 import asyncio
+from datetime import datetime
+from types import SimpleNamespace
 from unittest.mock import AsyncMock, MagicMock, Mock, patch
 
 import pytest
+from docker.errors import NotFound
 
-from mcp_devbench.managers.warm_pool_manager import WarmPoolManager
+from mcp_devbench.managers.warm_pool_manager import WORKSPACE_CLEAN_CMD, WarmPoolManager
 from mcp_devbench.models.containers import Container
 
 
+def _fake_docker(status: str, exit_code: int = 0) -> SimpleNamespace:
+    """Build a stand-in Docker container whose exec_run exits with exit_code."""
+    return SimpleNamespace(
+        status=status,
+        exec_run=lambda *args, **kwargs: SimpleNamespace(exit_code=exit_code),
+    )
+
+
 @pytest.fixture
 def mock_settings():
     """Create mock settings."""
     settings = Mock()
     settings.warm_pool_enabled = True
     settings.default_image_alias = "python:3.11-slim"
+    settings.warm_pool_size = 1
     settings.warm_health_check_interval = 60
     return settings
 
@@ -39,8 +51,6 @@ def warm_pool_manager(mock_settings, mock_container_manager):
 @pytest.fixture
 def mock_container():
     """Create a mock container."""
-    from datetime import datetime
-
     container = Container(
         id="c_123",
         docker_id="docker_123",
@@ -54,7 +64,6 @@ def mock_container():
     return container
 
 
-@pytest.mark.asyncio
 async def test_start_disabled(mock_settings, mock_container_manager):
     """Test starting warm pool when disabled."""
     mock_settings.warm_pool_enabled = False
@@ -69,7 +78,6 @@ async def test_start_disabled(mock_settings, mock_container_manager):
         mock_container_manager.create_container.assert_not_called()
 
 
-@pytest.mark.asyncio
 async def test_start_creates_warm_container(
     warm_pool_manager, mock_container_manager, mock_container
 ):
@@ -85,36 +93,31 @@ async def test_start_creates_warm_container(
     mock_container_manager.start_container.assert_called_once_with(mock_container.id)
 
 
-@pytest.mark.asyncio
 async def test_claim_warm_container_success(
     warm_pool_manager, mock_container_manager, mock_container
 ):
     """Test claiming a warm container successfully."""
     # Set up warm container
-    warm_pool_manager._warm_container = mock_container
+    warm_pool_manager._warm_pool.append(mock_container)
 
     # Mock the ensure_warm_container task
     with patch.object(warm_pool_manager, "_ensure_warm_container", return_value=None):
         claimed = await warm_pool_manager.claim_warm_container()
 
     assert claimed == mock_container
-    assert warm_pool_manager._warm_container is None
+    assert not warm_pool_manager._warm_pool
 
     # Should start creating new warm container
     # Note: asyncio.create_task is called, so we can't easily assert on it
 
 
-@pytest.mark.asyncio
 async def test_claim_warm_container_none_available(warm_pool_manager):
     """Test claiming when no warm container available."""
-    warm_pool_manager._warm_container = None
-
     claimed = await warm_pool_manager.claim_warm_container()
 
     assert claimed is None
 
 
-@pytest.mark.asyncio
 async def test_claim_warm_container_disabled(mock_settings, mock_container_manager):
     """Test claiming when warm pool is disabled."""
     mock_settings.warm_pool_enabled = False
@@ -128,24 +131,22 @@ async def test_claim_warm_container_disabled(mock_settings, mock_container_manag
     assert claimed is None
 
 
-@pytest.mark.asyncio
 async def test_ensure_warm_container(warm_pool_manager, mock_container_manager, mock_container):
     """Test ensuring a warm container exists."""
     mock_container_manager.create_container.return_value = mock_container
 
     await warm_pool_manager._ensure_warm_container()
 
-    assert warm_pool_manager._warm_container == mock_container
+    assert list(warm_pool_manager._warm_pool) == [mock_container]
     mock_container_manager.create_container.assert_called_once()
     mock_container_manager.start_container.assert_called_once_with(mock_container.id)
 
 
-@pytest.mark.asyncio
 async def test_ensure_warm_container_already_exists(
     warm_pool_manager, mock_container_manager, mock_container
 ):
     """Test ensuring warm container when one already exists."""
-    warm_pool_manager._warm_container = mock_container
+    warm_pool_manager._warm_pool.append(mock_container)
 
     await warm_pool_manager._ensure_warm_container()
 
@@ -153,73 +154,173 @@ async def test_ensure_warm_container_already_exists(
     mock_container_manager.create_container.assert_not_called()
 
 
-@pytest.mark.asyncio
 async def test_ensure_warm_container_failure(warm_pool_manager, mock_container_manager):
     """Test handling failure to create warm container."""
     mock_container_manager.create_container.side_effect = Exception("Creation failed")
 
     await warm_pool_manager._ensure_warm_container()
 
-    assert warm_pool_manager._warm_container is None
+    assert not warm_pool_manager._warm_pool
+
+
+async def test_ensure_warm_container_fills_pool(
+    warm_pool_manager, mock_settings, mock_container_manager
+):
+    """Test that ensuring the pool creates containers until it reaches warm_pool_size."""
+    mock_settings.warm_pool_size = 3
+    mock_container_manager.create_container.side_effect = [
+        SimpleNamespace(id=f"c_{i}") for i in range(3)
+    ]
+
+    await warm_pool_manager._ensure_warm_container()
+
+    assert [c.id for c in warm_pool_manager._warm_pool] == ["c_0", "c_1", "c_2"]
+    assert mock_container_manager.create_container.call_count == 3
+
+
+async def test_claim_not_blocked_by_refill_in_flight(
+    warm_pool_manager, mock_settings, mock_container_manager
+):
+    """Test that claims are served during a refill and do not start a second one."""
+    mock_settings.warm_pool_size = 2
+    warm_pool_manager._warm_pool.append(SimpleNamespace(id="c_warm"))
+
+    created = asyncio.Event()
+    new_ids = iter(["c_new1", "c_new2"])
+
+    async def slow_create(**kwargs):
+        await created.wait()
+        return SimpleNamespace(id=next(new_ids))
+
+    mock_container_manager.create_container.side_effect = slow_create
+
+    refill = asyncio.create_task(warm_pool_manager._ensure_warm_container())
+    await asyncio.sleep(0)
+
+    claimed = await asyncio.wait_for(warm_pool_manager.claim_warm_container(), timeout=1)
+    assert claimed.id == "c_warm"
+
+    created.set()
+    await refill
+    await warm_pool_manager._warm_creation_task
+
+    assert [c.id for c in warm_pool_manager._warm_pool] == ["c_new1", "c_new2"]
+    assert mock_container_manager.create_container.call_count == 2
+
+
+@pytest.mark.parametrize("pool_size", [1, 3])
+async def test_claim_burst_drains_pool_in_order(warm_pool_manager, mock_settings, pool_size):
+    """Test that a burst of claims is served warm until the pool runs dry."""
+    mock_settings.warm_pool_size = pool_size
+    warm_pool_manager._warm_pool.extend(SimpleNamespace(id=f"c_{i}") for i in range(pool_size))
+
+    with patch.object(warm_pool_manager, "_ensure_warm_container", return_value=None):
+        claimed = await asyncio.gather(
+            *(warm_pool_manager.claim_warm_container() for _ in range(pool_size + 1))
+        )
+
+    assert [c.id for c in claimed[:pool_size]] == [f"c_{i}" for i in range(pool_size)]
+    assert claimed[pool_size] is None
+
+
+async def test_check_warm_pool_evicts_unhealthy(warm_pool_manager, mock_container_manager):
+    """Test that the pool health check removes only the unhealthy containers."""
+    healthy, unhealthy = SimpleNamespace(id="c_ok"), SimpleNamespace(id="c_bad")
+    warm_pool_manager._warm_pool.extend([healthy, unhealthy])
+
+    with patch.object(warm_pool_manager, "_check_container_health", side_effect=[True, False]):
+        all_healthy = await warm_pool_manager._check_warm_pool()
+
+    assert all_healthy is False
+    assert list(warm_pool_manager._warm_pool) == [healthy]
+    mock_container_manager.remove_container.assert_called_once_with("c_bad", force=True)
+
+
+async def test_claim_not_blocked_by_health_check_in_flight(
+    warm_pool_manager, mock_container_manager
+):
+    """Test that claims are served during a health check and claimed containers are kept."""
+    warm_pool_manager._warm_pool.extend(SimpleNamespace(id=f"c_{i}") for i in range(2))
+
+    probed = asyncio.Event()
+
+    async def slow_probe(container):
+        await probed.wait()
+        return False
+
+    with (
+        patch.object(warm_pool_manager, "_check_container_health", side_effect=slow_probe),
+        patch.object(warm_pool_manager, "_ensure_warm_container", return_value=None),
+    ):
+        check = asyncio.create_task(warm_pool_manager._check_warm_pool())
+        await asyncio.sleep(0)
+
+        claimed = await asyncio.wait_for(warm_pool_manager.claim_warm_container(), timeout=1)
+        assert claimed.id == "c_0"
+
+        probed.set()
+        assert await check is False
+
+    # Only the container still pooled is evicted; the claimed one is left alone
+    assert not warm_pool_manager._warm_pool
+    mock_container_manager.remove_container.assert_called_once_with("c_1", force=True)
 
 
-@pytest.mark.asyncio
 async def test_check_container_health_healthy(
     warm_pool_manager, mock_container_manager, mock_container
 ):
     """Test checking health of a healthy container."""
-    # Mock Docker container
-    mock_docker_container = MagicMock()
-    mock_docker_container.status = "running"
-    mock_docker_container.exec_run.return_value = MagicMock(exit_code=0)
-
-    mock_container_manager.docker_client.containers.get.return_value = mock_docker_container
+    mock_container_manager.docker_client.containers.get.return_value = _fake_docker("running")
 
     is_healthy = await warm_pool_manager._check_container_health(mock_container)
 
     assert is_healthy is True
 
 
-@pytest.mark.asyncio
+async def test_check_container_health_runs_docker_calls_off_loop(
+    warm_pool_manager, mock_container_manager, mock_container
+):
+    """Test that the blocking Docker calls of a health check run in worker threads."""
+    mock_docker_container = _fake_docker("running")
+
+    containers = mock_container_manager.docker_client.containers
+    containers.get.return_value = mock_docker_container
+
+    with patch("asyncio.to_thread", wraps=asyncio.to_thread) as mock_to_thread:
+        assert await warm_pool_manager._check_container_health(mock_container) is True
+
+    offloaded = [c.args[0] for c in mock_to_thread.call_args_list]
+    assert offloaded == [containers.get, mock_docker_container.exec_run]
+
+
 async def test_check_container_health_not_running(
     warm_pool_manager, mock_container_manager, mock_container
 ):
     """Test checking health of a stopped container."""
-    # Mock Docker container
-    mock_docker_container = MagicMock()
-    mock_docker_container.status = "exited"
-
-    mock_container_manager.docker_client.containers.get.return_value = mock_docker_container
+    mock_container_manager.docker_client.containers.get.return_value = _fake_docker("exited")
 
     is_healthy = await warm_pool_manager._check_container_health(mock_container)
 
     assert is_healthy is False
 
 
-@pytest.mark.asyncio
 async def test_check_container_health_exec_failed(
     warm_pool_manager, mock_container_manager, mock_container
 ):
     """Test checking health when exec fails."""
-    # Mock Docker container
-    mock_docker_container = MagicMock()
-    mock_docker_container.status = "running"
-    mock_docker_container.exec_run.return_value = MagicMock(exit_code=1)
-
-    mock_container_manager.docker_client.containers.get.return_value = mock_docker_container
+    mock_container_manager.docker_client.containers.get.return_value = _fake_docker(
+        "running", exit_code=1
+    )
 
     is_healthy = await warm_pool_manager._check_container_health(mock_container)
 
     assert is_healthy is False
 
 
-@pytest.mark.asyncio
 async def test_check_container_health_not_found(
     warm_pool_manager, mock_container_manager, mock_container
 ):
     """Test checking health when container not found."""
-    from docker.errors import NotFound
-
     mock_container_manager.docker_client.containers.get.side_effect = NotFound("not found")
 
     is_healthy = await warm_pool_manager._check_container_health(mock_container)
@@ -227,7 +328,20 @@ async def test_check_container_health_not_found(
     assert is_healthy is False
 
 
-@pytest.mark.asyncio
+def test_health_check_interval_backs_off_while_healthy(warm_pool_manager):
+    """Test that healthy checks stretch the interval up to the cap and failures reset it."""
+    intervals = []
+    for _ in range(4):
+        warm_pool_manager._adjust_health_check_interval(is_healthy=True)
+        intervals.append(warm_pool_manager._health_check_interval)
+
+    assert intervals == [120, 240, 300, 300]
+
+    warm_pool_manager._adjust_health_check_interval(is_healthy=False)
+
+    assert warm_pool_manager._health_check_interval == 60
+
+
 async def test_stop(warm_pool_manager):
     """Test stopping the warm pool manager."""
     warm_pool_manager._is_running = True
@@ -250,7 +364,7 @@ async def test_stop(warm_pool_manager):
 
 def test_get_warm_container_id(warm_pool_manager, mock_container):
     """Test getting warm container ID."""
-    warm_pool_manager._warm_container = mock_container
+    warm_pool_manager._warm_pool.append(mock_container)
 
     container_id = warm_pool_manager.get_warm_container_id()
 
@@ -259,14 +373,11 @@ def test_get_warm_container_id(warm_pool_manager, mock_container):
 
 def test_get_warm_container_id_none(warm_pool_manager):
     """Test getting warm container ID when none exists."""
-    warm_pool_manager._warm_container = None
-
     container_id = warm_pool_manager.get_warm_container_id()
 
     assert container_id is None
 
 
-@pytest.mark.asyncio
 async def test_clean_workspace(warm_pool_manager, mock_container_manager, mock_container):
     """Test cleaning workspace."""
     # Mock getting container
@@ -289,9 +400,11 @@ async def test_clean_workspace(warm_pool_manager, mock_container_manager, mock_c
 
             # Verify exec_run was called with the cleanup command
             assert mock_to_thread.call_count == 2
+            exec_call = mock_to_thread.call_args_list[1]
+            assert exec_call.args[0] is mock_docker_container.exec_run
+            assert exec_call.kwargs["cmd"] == list(WORKSPACE_CLEAN_CMD)
 
 
-@pytest.mark.asyncio
 async def test_clean_workspace_failure(warm_pool_manager, mock_container_manager, mock_container):
     """Test handling workspace cleanup failure."""
     # Mock getting container to fail
@@ -304,25 +417,24 @@ async def test_clean_workspace_failure(warm_pool_manager, mock_container_manager
         await warm_pool_manager._clean_workspace(mock_container.id)
 
 
-@pytest.mark.asyncio
 async def test_claim_with_alias(warm_pool_manager, mock_container_manager, mock_container):
     """Test claiming warm container with an alias."""
-    warm_pool_manager._warm_container = mock_container
+    warm_pool_manager._warm_pool.append(mock_container)
+
+    mock_session = AsyncMock()
+    mock_repo = AsyncMock()
+    mock_repo.get.return_value = mock_container
 
     # Mock database operations
-    with patch("mcp_devbench.models.database.get_db_manager") as mock_db_manager:
-        mock_session = AsyncMock()
+    with (
+        patch("mcp_devbench.models.database.get_db_manager") as mock_db_manager,
+        patch("mcp_devbench.repositories.containers.ContainerRepository", return_value=mock_repo),
+        patch.object(warm_pool_manager, "_ensure_warm_container", return_value=None),
+    ):
         mock_db_manager.return_value.get_session.return_value.__aenter__.return_value = mock_session
-        mock_session.execute = AsyncMock()
-        mock_session.commit = AsyncMock()
-
-        # Mock ContainerRepository
-        with patch("mcp_devbench.repositories.containers.ContainerRepository") as mock_repo_class:
-            mock_repo = AsyncMock()
-            mock_repo.get.return_value = mock_container
-            mock_repo_class.return_value = mock_repo
 
-            with patch.object(warm_pool_manager, "_ensure_warm_container", return_value=None):
-                claimed = await warm_pool_manager.claim_warm_container(alias="my-container")
+        claimed = await warm_pool_manager.claim_warm_container(alias="my-container")
 
-            assert claimed.id == mock_container.id
+    assert claimed.id == mock_container.id
+    assert claimed.alias == "my-container"
+    mock_session.commit.assert_awaited_once()